@@ -19,10 +19,15 @@ from typing import AsyncGenerator, Optional
 import uvicorn
 from fastapi import FastAPI, HTTPException, Query, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
+from sqlalchemy import delete, update
 
-from job_track.db.models import Job, Profile, ScraperSource, get_resume_dir, get_session, init_db
+from job_track.db.models import (
+    Job, Profile, ScraperSource, get_resume_dir, get_session, init_db, insert_new_jobs, job_search_filter,
+    job_tag_filter,
+)
+from job_track.dedup import canonicalize_url
 from job_track.scraper import simplify_jobs
 from job_track.scraper.simplify_jobs import SimplifyJobsScraper, SimplifyJobsConfig
 from job_track.scraper.hiring_cafe import HiringCafeScraper, SearchConfig
@@ -31,6 +36,22 @@ from job_track.scraper.scraper import (
 )
 
 
+# orjson is optional - responses fall back to the json module if not installed
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+class _ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson, several times faster than json.dumps."""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan context manager for app startup/shutdown."""
@@ -45,6 +66,7 @@ app = FastAPI(
     description="Local API for job tracking and application management",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=_ORJSONResponse if ORJSON_AVAILABLE else JSONResponse,
 )
 
 # Allow CORS from localhost/browser extension
@@ -182,14 +204,9 @@ async def list_jobs(
         if is_pending is not None:
             query = query.filter(Job.is_pending == is_pending)
         if tag:
-            query = query.filter(Job.tags.contains(f'"{tag}"'))
+            query = query.filter(job_tag_filter(tag))
         if search:
-            search_term = f"%{search}%"
-            query = query.filter(
-                (Job.title.ilike(search_term))
-                | (Job.company.ilike(search_term))
-                | (Job.description.ilike(search_term))
-            )
+            query = query.filter(job_search_filter(session, search))
 
         total = query.count()
         jobs = query.order_by(Job.scraped_at.desc()).offset(offset).limit(limit).all()
@@ -282,11 +299,11 @@ async def mark_job_pending(job_id: str):
     """Mark a job as pending (user clicked apply link)."""
     session = get_session()
     try:
-        job = session.query(Job).filter(Job.id == job_id).first()
-        if not job:
+        # One UPDATE; the row count tells whether the job exists
+        result = session.execute(update(Job).where(Job.id == job_id).values(is_pending=True))
+        if not result.rowcount:
             raise HTTPException(status_code=404, detail="Job not found")
 
-        job.is_pending = True
         session.commit()
         return {"status": "pending", "job_id": job_id}
     finally:
@@ -322,11 +339,10 @@ async def delete_job(job_id: str):
     """Delete a job listing."""
     session = get_session()
     try:
-        job = session.query(Job).filter(Job.id == job_id).first()
-        if not job:
+        result = session.execute(delete(Job).where(Job.id == job_id))
+        if not result.rowcount:
             raise HTTPException(status_code=404, detail="Job not found")
 
-        session.delete(job)
         session.commit()
         return {"status": "deleted", "job_id": job_id}
     finally:
@@ -614,7 +630,7 @@ async def scrape_jobs(request: ScrapeRequest):
                     for scraped_job in jobs:
                         # Check if job already exists
                         existing = session.query(Job).filter(
-                            Job.apply_url == scraped_job.apply_url
+                            Job.canonical_url == canonicalize_url(scraped_job.apply_url)
                         ).first()
                         if existing:
                             results["skipped"] += 1
@@ -690,7 +706,7 @@ async def scrape_hiring_cafe(request: HiringCafeScrapeRequest):
             try:
                 # Check if job already exists
                 existing = session.query(Job).filter(
-                    Job.apply_url == scraped_job.apply_url
+                    Job.canonical_url == canonicalize_url(scraped_job.apply_url)
                 ).first()
                 if existing:
                     results["skipped"] += 1
@@ -780,43 +796,46 @@ async def scrape_simplify_jobs(request: SimplifyJobsScrapeRequest):
     repository README for curated new-grad job listings.
     """
 
-    session = get_session()
     results = {"scraped": 0, "added": 0, "skipped": 0, "errors": []}
     jobs = await simplify_jobs.scrape_simplify_jobs(simplify_jobs.SimplifyJobsConfig.software_engineering())
-    print ("HIIII")
     results["scraped"] = len(jobs)
-    for scraped_job in jobs:
+
+    rows = [
+        {
+            "id": scraped_job.generate_id(),
+            "title": scraped_job.title,
+            "company": scraped_job.company,
+            "location": scraped_job.location,
+            "description": scraped_job.description,
+            "apply_url": scraped_job.apply_url,
+            "source_url": scraped_job.source_url,
+            "tags": scraped_job.tags,
+        }
+        for scraped_job in jobs
+    ]
+
+    session = get_session()
+    try:
         try:
-            # Check if job already exists
-            existing = session.query(Job).filter(
-                Job.apply_url == scraped_job.apply_url
-            ).first()
-            if existing:
-                results["skipped"] += 1
-                continue
-
-
-            job = Job(
-                id=scraped_job.generate_id(),
-                title=scraped_job.title,
-                company=scraped_job.company,
-                location=scraped_job.location,
-                description=scraped_job.description,
-                apply_url=scraped_job.apply_url,
-                source_url=scraped_job.source_url,
-            )
-            job.set_tags(scraped_job.tags)
-            session.add(job)
+            # One existence query and one insert for the whole listing
+            results["added"] = insert_new_jobs(session, rows)
             session.commit()
-            results["added"] += 1
-
-        except Exception as e:
-            results["errors"].append({
-                "job": scraped_job.title,
-                "error": str(e),
-            })
-        finally:
-            session.close()
+        except Exception:
+            session.rollback()
+            # Save job by job so only the failing jobs are lost and reported
+            for row in rows:
+                try:
+                    results["added"] += insert_new_jobs(session, [row])
+                    session.commit()
+                except Exception as e:
+                    session.rollback()
+                    results["errors"].append({
+                        "job": row["title"],
+                        "error": str(e),
+                    })
+    finally:
+        session.close()
+    results["skipped"] = len(jobs) - results["added"] - len(results["errors"])
 
     return results
 
@@ -1056,7 +1075,7 @@ async def scrape_source_stream(source_id: str):
                             if not job.apply_url:
                                 continue
                             existing = db_session.query(Job).filter(
-                                Job.apply_url == job.apply_url
+                                Job.canonical_url == canonicalize_url(job.apply_url)
                             ).first()
                             if existing:
                                 results["skipped"] += 1
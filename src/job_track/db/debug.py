@@ -0,0 +1,94 @@
+"""SQL query instrumentation for development.
+
+Enabled with ``--debug-queries``. Every statement is counted and written to
+a log file (the TUI owns the terminal), and statements repeated many times
+within one action are flagged as likely N+1 loops. Nothing is registered
+unless debugging is enabled, so there is no overhead otherwise.
+"""
+
+import logging
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger("job_track.queries")
+
+# Executions of one statement within an action that suggest an N+1 loop
+REPEAT_WARNING_THRESHOLD = 5
+
+
+class QueryLog:
+    """Statements executed since the last call to take()."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._statements: Counter[str] = Counter()
+
+    def record(self, statement: str) -> None:
+        """Record one executed statement."""
+        with self._lock:
+            self._statements[statement] += 1
+
+    def take(self) -> int:
+        """Return the number of statements since the last call and reset.
+
+        Statements executed at least REPEAT_WARNING_THRESHOLD times are
+        logged as possible N+1 queries.
+        """
+        with self._lock:
+            statements, self._statements = self._statements, Counter()
+        for statement, count in statements.items():
+            if count >= REPEAT_WARNING_THRESHOLD:
+                logger.warning("Statement ran %d times (possible N+1): %s", count, statement)
+        return sum(statements.values())
+
+
+_query_log: Optional[QueryLog] = None
+_handler: Optional[logging.Handler] = None
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if _query_log is not None:
+        _query_log.record(statement)
+    logger.debug("%s %r", statement, parameters)
+
+
+def enable_query_debugging(log_path: Path) -> QueryLog:
+    """Start counting and logging SQL statements on every engine.
+
+    Args:
+        log_path: File that executed statements are written to.
+
+    Returns:
+        The query log collecting statement counts.
+    """
+    global _query_log, _handler
+    if _query_log is None:
+        _query_log = QueryLog()
+        _handler = logging.FileHandler(log_path)
+        _handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(threadName)s %(message)s"))
+        logger.addHandler(_handler)
+        logger.setLevel(logging.DEBUG)
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    return _query_log
+
+
+def disable_query_debugging() -> None:
+    """Stop counting and logging SQL statements."""
+    global _query_log, _handler
+    if _query_log is None:
+        return
+    event.remove(Engine, "before_cursor_execute", _before_cursor_execute)
+    logger.removeHandler(_handler)
+    _handler.close()
+    _query_log = None
+    _handler = None
+
+
+def get_query_log() -> Optional[QueryLog]:
+    """Return the active query log, or None if debugging is off."""
+    return _query_log
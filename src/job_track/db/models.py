@@ -5,12 +5,21 @@ This module defines SQLAlchemy models for jobs and profiles.
 
 import datetime
 import json
+import threading
 import uuid
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
-from sqlalchemy import Boolean, DateTime, Integer, String, Text, create_engine, func
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, sessionmaker
+from sqlalchemy import (
+    BigInteger, Boolean, DateTime, ForeignKey, Index, Integer, String, Text, create_engine, event, func, insert,
+    text,
+)
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship, sessionmaker, validates
+
+from job_track.dedup import SimHashIndex, canonicalize_url, job_simhash
 
 
 class Base(DeclarativeBase):
@@ -29,6 +38,8 @@ class Job(Base):
         location: Job location.
         description: Full job description text.
         apply_url: URL to apply for the job on company site.
+        canonical_url: apply_url with tracking parameters stripped, used
+            as the de-duplication key. Kept in sync with apply_url.
         source_url: Original URL where job was scraped from.
         posted_at: Timestamp when job was posted (if available).
         scraped_at: Timestamp when job was scraped.
@@ -37,9 +48,22 @@ class Job(Base):
         applied_at: Timestamp when user applied.
         profile_id: ID of profile used when applying.
         resume_version: Version of resume used when applying.
+        simhash: SimHash fingerprint of title, company and description,
+            used to detect reposts of the same job across sources.
     """
 
     __tablename__ = "jobs"
+    __table_args__ = (
+        # Flag filters ordered by recency (API job listing); the single-flag
+        # indexes let a filter on either flag alone stream rows in order
+        Index("ix_jobs_filter_order", "is_applied", "is_pending", "scraped_at"),
+        Index("ix_jobs_applied_scraped", "is_applied", "scraped_at"),
+        Index("ix_jobs_pending_scraped", "is_pending", "scraped_at"),
+        # 90-day window ordered by recency (TUI job list)
+        Index("ix_jobs_scraped_at", "scraped_at"),
+        # Application history ordered by applied date
+        Index("ix_jobs_applied_at", "is_applied", "applied_at"),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     title: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -47,6 +71,7 @@ class Job(Base):
     location: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     apply_url: Mapped[str] = mapped_column(String(2048), nullable=False)
+    canonical_url: Mapped[Optional[str]] = mapped_column(String(2048), nullable=True, index=True)
     source_url: Mapped[Optional[str]] = mapped_column(String(2048), nullable=True)
     posted_at: Mapped[Optional[datetime.datetime]] = mapped_column(
         DateTime, nullable=True
@@ -62,6 +87,18 @@ class Job(Base):
     )
     profile_id: Mapped[Optional[str]] = mapped_column(String(36), nullable=True)
     resume_version: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)  # Version name or ID
+    simhash: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
+
+    # One row per tag, kept in sync with the tags column by triggers; only
+    # used to build filters such as Job.tag_rows.any(JobTag.tag == "new-grad"),
+    # so loading it is an error
+    tag_rows: Mapped[list["JobTag"]] = relationship(lazy="raise", viewonly=True)
+
+    @validates("apply_url")
+    def _sync_canonical_url(self, key: str, value: str) -> str:
+        """Keep canonical_url in sync whenever apply_url is set."""
+        self.canonical_url = canonicalize_url(value) if value else value
+        return value
 
     def get_tags(self) -> list[str]:
         """Parse tags JSON into a list."""
@@ -93,6 +130,69 @@ class Job(Base):
         }
 
 
+class JobTag(Base):
+    """A single tag of a job, normalized out of Job.tags for indexed filtering.
+
+    Rows are maintained by SQLite triggers on the jobs table (see
+    _JOB_TAGS_DDL), so Job.set_tags and bulk inserts need no extra work.
+    """
+
+    __tablename__ = "job_tags"
+    __table_args__ = (
+        Index("ix_job_tags_tag", "tag", "job_id"),
+    )
+
+    job_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True
+    )
+    tag: Mapped[str] = mapped_column(String(100), primary_key=True)
+
+
+# Columns needed to render a job in a list (see JobSummary)
+JOB_SUMMARY_COLUMNS = (
+    Job.id,
+    Job.title,
+    Job.company,
+    Job.location,
+    Job.apply_url,
+    Job.tags,
+    Job.is_applied,
+    Job.is_pending,
+)
+
+
+@dataclass(slots=True)
+class JobSummary:
+    """Lightweight job record for list views.
+
+    Built straight from a ``session.query(*JOB_SUMMARY_COLUMNS)`` row, so
+    list views skip ORM hydration and the large text columns entirely.
+    """
+
+    id: str
+    title: str
+    company: str
+    location: Optional[str]
+    apply_url: str
+    tags: list[str]
+    is_applied: bool
+    is_pending: bool
+
+    @classmethod
+    def from_row(cls, row) -> "JobSummary":
+        """Create a summary from a JOB_SUMMARY_COLUMNS row."""
+        return cls(
+            id=row.id,
+            title=row.title,
+            company=row.company,
+            location=row.location,
+            apply_url=row.apply_url,
+            tags=json.loads(row.tags) if row.tags else [],
+            is_applied=row.is_applied,
+            is_pending=row.is_pending,
+        )
+
+
 class ScraperSource(Base):
     """Model representing a configured scraping source.
 
@@ -278,7 +378,7 @@ class Profile(Base):
     portfolio_url: Mapped[Optional[str]] = mapped_column(String(2048), nullable=True)
     resume_versions: Mapped[Optional[str]] = mapped_column(
         Text, nullable=True
-    )  # JSON array of {id, name, filename, uploaded_at, is_named}
+    )  # JSON array of {id, name, filename, uploaded_at, is_named, sha256?}
     created_at: Mapped[datetime.datetime] = mapped_column(
         DateTime, default=func.now(), nullable=False
     )
@@ -292,12 +392,15 @@ class Profile(Base):
             return []
         return json.loads(self.resume_versions)
 
-    def add_resume_version(self, filename: str, name: Optional[str] = None) -> dict:
+    def add_resume_version(
+        self, filename: str, name: Optional[str] = None, sha256: Optional[str] = None
+    ) -> dict:
         """Add a new resume version and return the version info.
         
         Args:
             filename: The filename of the resume.
             name: Optional name for the revision. If provided, this is a named revision.
+            sha256: Optional SHA-256 hex digest of the file, used to detect re-uploads.
             
         Returns:
             The new version metadata dict.
@@ -313,6 +416,8 @@ class Profile(Base):
             "uploaded_at": datetime.datetime.now().isoformat(),
             "is_named": is_named,
         }
+        if sha256 is not None:
+            new_version["sha256"] = sha256
         versions.append(new_version)
         
         # Keep named versions + 5 most recent unnamed versions
@@ -400,11 +505,216 @@ def get_resume_dir(profile_id: str) -> Path:
     return resume_dir
 
 
+# Connection-level SQLite settings. WAL lets the TUI keep reading while a
+# scrape commits, and synchronous=NORMAL avoids an fsync on every commit
+# (still durable across application crashes in WAL mode).
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",  # 64 MiB page cache
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MiB
+)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Apply SQLITE_PRAGMAS to every new DBAPI connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+# Engines and session factories are cached per database path so each
+# get_session() reuses pooled connections instead of opening a new engine
+_engines: dict[Path, Engine] = {}
+_session_factories: dict[Path, sessionmaker] = {}
+_engine_lock = threading.Lock()
+_session_lock = threading.Lock()
+
+
 def get_engine(db_path: Optional[Path] = None):
-    """Create database engine."""
+    """Get the (cached) database engine for a database file."""
     if db_path is None:
         db_path = get_db_path()
-    return create_engine(f"sqlite:///{db_path}", echo=False)
+    with _engine_lock:
+        engine = _engines.get(db_path)
+        if engine is None:
+            engine = create_engine(
+                f"sqlite:///{db_path}",
+                echo=False,
+                pool_size=5,
+                max_overflow=10,
+                pool_use_lifo=True,
+                # Sessions are opened from TUI worker threads as well
+                connect_args={"check_same_thread": False},
+            )
+            event.listen(engine, "connect", _set_sqlite_pragmas)
+            _engines[db_path] = engine
+    return engine
+
+
+# Trigram full-text index over the searchable job text. Trigram matching
+# is a case-insensitive substring match, so it gives the same results as
+# ILIKE '%term%' but can use the index for terms of 3+ characters.
+_JOB_FTS_DDL = (
+    """CREATE VIRTUAL TABLE jobs_fts USING fts5(
+        title, company, description, content='jobs', content_rowid='rowid', tokenize='trigram'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS jobs_fts_ai AFTER INSERT ON jobs BEGIN
+        INSERT INTO jobs_fts(rowid, title, company, description)
+        VALUES (new.rowid, new.title, new.company, new.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS jobs_fts_ad AFTER DELETE ON jobs BEGIN
+        INSERT INTO jobs_fts(jobs_fts, rowid, title, company, description)
+        VALUES ('delete', old.rowid, old.title, old.company, old.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS jobs_fts_au AFTER UPDATE OF title, company, description ON jobs BEGIN
+        INSERT INTO jobs_fts(jobs_fts, rowid, title, company, description)
+        VALUES ('delete', old.rowid, old.title, old.company, old.description);
+        INSERT INTO jobs_fts(rowid, title, company, description)
+        VALUES (new.rowid, new.title, new.company, new.description);
+    END""",
+    "INSERT INTO jobs_fts(jobs_fts) VALUES ('rebuild')",
+)
+
+# Shortest search term the trigram index can match
+_FTS_MIN_TERM_LENGTH = 3
+
+
+def _create_job_fts(engine) -> None:
+    """Create the jobs full-text index if SQLite supports it."""
+    with engine.connect() as conn:
+        exists = conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'jobs_fts'")
+        ).first()
+        if exists:
+            return
+        try:
+            for statement in _JOB_FTS_DDL:
+                conn.execute(text(statement))
+            conn.commit()
+        except OperationalError:
+            # SQLite built without FTS5 or the trigram tokenizer; search
+            # falls back to ILIKE
+            conn.rollback()
+
+
+# Keep job_tags in step with the JSON tags column. Foreign keys are not
+# enforced on our connections, so deletes are handled here too.
+_JOB_TAGS_DDL = (
+    """CREATE TRIGGER IF NOT EXISTS job_tags_ai AFTER INSERT ON jobs BEGIN
+        INSERT OR IGNORE INTO job_tags(job_id, tag)
+        SELECT new.id, value FROM json_each(coalesce(new.tags, '[]'));
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS job_tags_ad AFTER DELETE ON jobs BEGIN
+        DELETE FROM job_tags WHERE job_id = old.id;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS job_tags_au AFTER UPDATE OF id, tags ON jobs BEGIN
+        DELETE FROM job_tags WHERE job_id = old.id;
+        INSERT OR IGNORE INTO job_tags(job_id, tag)
+        SELECT new.id, value FROM json_each(coalesce(new.tags, '[]'));
+    END""",
+    """INSERT OR IGNORE INTO job_tags(job_id, tag)
+        SELECT jobs.id, tag.value FROM jobs, json_each(coalesce(jobs.tags, '[]')) AS tag""",
+)
+
+
+def _create_job_tags(engine) -> None:
+    """Create the job_tags sync triggers, backfilling existing jobs once."""
+    with engine.connect() as conn:
+        exists = conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = 'job_tags_ai'")
+        ).first()
+        if exists:
+            return
+        for statement in _JOB_TAGS_DDL:
+            conn.execute(text(statement))
+        conn.commit()
+
+
+def job_tag_filter(tag: str):
+    """Build a filter matching jobs that have exactly the given tag."""
+    return Job.tag_rows.any(JobTag.tag == tag)
+
+
+def job_search_filter(session, search: str):
+    """Build a filter matching jobs whose title, company or description contain search.
+
+    Uses the trigram full-text index when available, falling back to ILIKE
+    for short terms or databases without the index.
+    """
+    has_fts = len(search) >= _FTS_MIN_TERM_LENGTH and session.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'jobs_fts'")
+    ).first()
+    if has_fts:
+        phrase = '"' + search.replace('"', '""') + '"'
+        return text(
+            "jobs.rowid IN (SELECT rowid FROM jobs_fts WHERE jobs_fts MATCH :phrase)"
+        ).bindparams(phrase=phrase)
+
+    term = f"%{search}%"
+    return (Job.title.ilike(term)) | (Job.company.ilike(term)) | (Job.description.ilike(term))
+
+
+# Values per IN (...) clause, kept well under SQLite's bound parameter limit
+_IN_CLAUSE_CHUNK = 500
+
+
+def insert_new_jobs(session, rows: list[dict], fingerprints: Optional[SimHashIndex] = None) -> int:
+    """Insert the jobs whose URL is not stored yet, as one batch.
+
+    Existing URLs are found with one query per chunk of canonical URLs
+    instead of one per job, and the new rows are inserted with a single
+    executemany. Rows repeating an earlier row's canonical URL or ``id``
+    are dropped, so the batch cannot collide with itself. The caller
+    commits.
+
+    Args:
+        session: Database session.
+        rows: Job column values; ``tags`` may be given as a list.
+        fingerprints: If given, jobs within SimHash distance of an indexed
+            fingerprint are skipped, and inserted fingerprints are added.
+
+    Returns:
+        The number of jobs inserted.
+    """
+    by_url: dict[str, dict] = {}
+    seen_ids = set()
+    for row in rows:
+        if "id" in row:
+            if row["id"] in seen_ids:
+                continue
+            seen_ids.add(row["id"])
+        by_url.setdefault(canonicalize_url(row["apply_url"]), row)
+
+    urls = list(by_url)
+    for start in range(0, len(urls), _IN_CLAUSE_CHUNK):
+        chunk = urls[start:start + _IN_CLAUSE_CHUNK]
+        for (url,) in session.query(Job.canonical_url).filter(Job.canonical_url.in_(chunk)):
+            by_url.pop(url, None)
+
+    # The bulk path skips the ORM validators and set_tags, so fill in
+    # canonical_url and serialize tags here
+    new_rows = []
+    for url, row in by_url.items():
+        row = {**row, "canonical_url": url}
+        if isinstance(row.get("tags"), list):
+            row["tags"] = json.dumps(row["tags"]) if row["tags"] else None
+        if fingerprints is not None:
+            fingerprint = job_simhash(row["title"], row["company"], row.get("description"))
+            if fingerprint is not None:
+                if fingerprints.find_near(fingerprint) is not None:
+                    continue
+                fingerprints.add(fingerprint)
+            row["simhash"] = fingerprint
+        new_rows.append(row)
+
+    if new_rows:
+        session.execute(insert(Job), new_rows)
+    return len(new_rows)
 
 
 def _migrate_db(engine):
@@ -452,9 +762,28 @@ def _migrate_db(engine):
         with engine.connect() as conn:
             if "posted_at" not in columns:
                 conn.execute(text("ALTER TABLE jobs ADD COLUMN posted_at DATETIME"))
+            if "canonical_url" not in columns:
+                conn.execute(text("ALTER TABLE jobs ADD COLUMN canonical_url VARCHAR(2048)"))
+                rows = conn.execute(text("SELECT id, apply_url FROM jobs")).fetchall()
+                if rows:
+                    conn.execute(
+                        text("UPDATE jobs SET canonical_url = :canonical_url WHERE id = :id"),
+                        [{"id": row.id, "canonical_url": canonicalize_url(row.apply_url)} for row in rows],
+                    )
+            conn.execute(text("CREATE INDEX IF NOT EXISTS ix_jobs_canonical_url ON jobs (canonical_url)"))
+            if "simhash" not in columns:
+                conn.execute(text("ALTER TABLE jobs ADD COLUMN simhash BIGINT"))
+            # Fingerprints are only ever read in bulk, never filtered on
+            conn.execute(text("DROP INDEX IF EXISTS ix_jobs_simhash"))
+            for index in Job.__table__.indexes:
+                index.create(conn, checkfirst=True)
             # Also handle resume_version type change (was int, now string)
             conn.commit()
     
+    if "jobs" in inspector.get_table_names():
+        _create_job_fts(engine)
+        _create_job_tags(engine)
+
     # Create default scraper sources if table is new and empty
     if "scraper_sources" in inspector.get_table_names():
         with engine.connect() as conn:
@@ -489,7 +818,16 @@ def init_db(db_path: Optional[Path] = None):
 
 
 def get_session(db_path: Optional[Path] = None):
-    """Get a database session."""
-    engine = init_db(db_path)
-    Session = sessionmaker(bind=engine)
+    """Get a database session, initializing the database on first use."""
+    if db_path is None:
+        db_path = get_db_path()
+    Session = _session_factories.get(db_path)
+    if Session is None:
+        # The TUI opens its first sessions from several worker threads at
+        # once; only one of them should run the schema setup
+        with _session_lock:
+            Session = _session_factories.get(db_path)
+            if Session is None:
+                Session = sessionmaker(bind=init_db(db_path))
+                _session_factories[db_path] = Session
     return Session()
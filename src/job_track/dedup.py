@@ -0,0 +1,171 @@
+"""De-duplication helpers for scraped jobs.
+
+The same posting is frequently listed on several boards with slightly
+different wording, or under URLs that differ only by tracking parameters.
+This module provides URL canonicalization, a 64-bit SimHash fingerprint and
+a small index for finding near-duplicate fingerprints quickly.
+"""
+
+import hashlib
+import re
+from collections import Counter
+from typing import Iterable, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only carry tracking information
+TRACKING_PARAM_PREFIXES = ("utm_", "lever-", "_hs")
+TRACKING_PARAMS = frozenset({
+    "fbclid", "gclid", "dclid", "msclkid", "yclid", "igshid",
+    "mc_cid", "mc_eid", "gh_src", "ref", "ref_src", "referrer", "trk",
+})
+
+SIMHASH_BITS = 64
+
+# Maximum Hamming distance between two fingerprints considered duplicates
+SIMHASH_MAX_DISTANCE = 3
+
+# Descriptions shorter than this are too small to fingerprint reliably;
+# e.g. two different "Software Engineer" openings at the same company
+# would otherwise collapse into one.
+MIN_SIMHASH_TOKENS = 20
+
+_TOKEN_RE = re.compile(r"\w+")
+_MASK = (1 << SIMHASH_BITS) - 1
+_SIGN_BIT = 1 << (SIMHASH_BITS - 1)
+
+
+def canonicalize_url(url: str) -> str:
+    """Normalize a job URL so variants of the same posting compare equal.
+
+    Lowercases the scheme and host, drops tracking query parameters, sorts
+    the remaining parameters and strips trailing slashes. Fragments are
+    dropped unless they look like client-side routes (``#/jobs/123``).
+
+    Args:
+        url: URL to canonicalize.
+
+    Returns:
+        The canonical URL, or the stripped input if it is not absolute.
+    """
+    url = url.strip()
+    parts = urlsplit(url)
+    if not parts.scheme or not parts.netloc:
+        return url
+
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS
+        and not key.lower().startswith(TRACKING_PARAM_PREFIXES)
+    )
+    fragment = parts.fragment if parts.fragment.startswith(("/", "!/")) else ""
+    return urlunsplit((
+        parts.scheme.lower(),
+        parts.netloc.lower(),
+        parts.path.rstrip("/"),
+        urlencode(query),
+        fragment,
+    ))
+
+
+def _tokens(text: str) -> list[str]:
+    """Split text into lowercase word tokens."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _to_signed(value: int) -> int:
+    """Convert an unsigned 64-bit value to signed so it fits SQLite INTEGER."""
+    return value - (1 << SIMHASH_BITS) if value & _SIGN_BIT else value
+
+
+def simhash(text: str) -> int:
+    """Compute a 64-bit SimHash fingerprint of text.
+
+    Args:
+        text: Text to fingerprint.
+
+    Returns:
+        The fingerprint as a signed 64-bit integer.
+    """
+    weights = [0] * SIMHASH_BITS
+    for token, count in Counter(_tokens(text)).items():
+        digest = hashlib.blake2b(token.encode(), digest_size=8).digest()
+        token_hash = int.from_bytes(digest, "big")
+        for bit in range(SIMHASH_BITS):
+            if token_hash >> bit & 1:
+                weights[bit] += count
+            else:
+                weights[bit] -= count
+
+    value = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            value |= 1 << bit
+    return _to_signed(value)
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Count the differing bits between two fingerprints."""
+    return ((a ^ b) & _MASK).bit_count()
+
+
+def job_simhash(title: str, company: str, description: Optional[str]) -> Optional[int]:
+    """Fingerprint a job from its title, company and description.
+
+    Returns:
+        The fingerprint, or None if the description is too short to
+        fingerprint reliably.
+    """
+    if not description or len(_tokens(description)) < MIN_SIMHASH_TOKENS:
+        return None
+    return simhash(f"{title} {company} {description}")
+
+
+class SimHashIndex:
+    """Index of SimHash fingerprints supporting near-duplicate lookups.
+
+    Each fingerprint is split into ``max_distance + 1`` bit blocks. Two
+    fingerprints within ``max_distance`` bits of each other must share at
+    least one block exactly, so only fingerprints sharing a block need to
+    be compared.
+    """
+
+    def __init__(self, hashes: Iterable[int] = (), max_distance: int = SIMHASH_MAX_DISTANCE):
+        """Initialize the index.
+
+        Args:
+            hashes: Initial fingerprints to add.
+            max_distance: Maximum Hamming distance treated as a duplicate.
+        """
+        self.max_distance = max_distance
+        num_blocks = max_distance + 1
+        width = SIMHASH_BITS // num_blocks
+        self._blocks = [
+            (i * width, (1 << (width if i < num_blocks - 1 else SIMHASH_BITS - i * width)) - 1)
+            for i in range(num_blocks)
+        ]
+        self._buckets: list[dict[int, list[int]]] = [{} for _ in self._blocks]
+        self._size = 0
+        for value in hashes:
+            self.add(value)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _keys(self, value: int) -> list[int]:
+        value &= _MASK
+        return [(value >> shift) & mask for shift, mask in self._blocks]
+
+    def add(self, value: int) -> None:
+        """Add a fingerprint to the index."""
+        for bucket, key in zip(self._buckets, self._keys(value)):
+            bucket.setdefault(key, []).append(value)
+        self._size += 1
+
+    def find_near(self, value: int) -> Optional[int]:
+        """Return an indexed fingerprint within max_distance of value, if any."""
+        for bucket, key in zip(self._buckets, self._keys(value)):
+            for candidate in bucket.get(key, ()):
+                if hamming_distance(value, candidate) <= self.max_distance:
+                    return candidate
+        return None
@@ -16,7 +16,10 @@ def main():
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
     # TUI command
-    subparsers.add_parser("tui", help="Launch the TUI interface")
+    tui_parser = subparsers.add_parser("tui", help="Launch the TUI interface")
+    tui_parser.add_argument(
+        "--debug-queries", action="store_true", help="Log SQL statements and show query counts"
+    )
 
     # API server command
     api_parser = subparsers.add_parser("api", help="Start the API server")
@@ -48,7 +51,7 @@ def main():
 
     if args.command == "tui" or args.command is None:
         from job_track.tui.app import main as tui_main
-        tui_main()
+        tui_main(debug_queries=getattr(args, "debug_queries", False))
     elif args.command == "api":
         from job_track.api.server import run
         run()
@@ -63,6 +66,7 @@ def main():
 def run_scrape(urls: list[str], filter_new_grad: bool):
     """Run the scraper and add jobs to database."""
     from job_track.db.models import Job, get_session, init_db
+    from job_track.dedup import canonicalize_url
     from job_track.scraper.scraper import scrape_jobs_sync
 
     init_db()
@@ -74,9 +78,9 @@ def run_scrape(urls: list[str], filter_new_grad: bool):
     try:
         added = 0
         for scraped_job in jobs:
-            # Check if job already exists (by apply_url)
-            existing = session.query(Job).filter(
-                Job.apply_url == scraped_job.apply_url
+            # Check if job already exists (by indexed canonical URL)
+            existing = session.query(Job.id).filter(
+                Job.canonical_url == canonicalize_url(scraped_job.apply_url)
             ).first()
             if existing:
                 print(f"  Skipped (exists): {scraped_job.title}")
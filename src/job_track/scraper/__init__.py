@@ -4,6 +4,7 @@ This module provides job scraping functionality for various sources:
 - Generic web scraping with Playwright and BeautifulSoup
 - Specialized hiring.cafe scraper for aggregated job listings
 - SimplifyJobs GitHub scraper for new-grad positions
+- Near-duplicate detection for reposted jobs
 """
 
 from .scraper import (
@@ -28,6 +29,19 @@ from .simplify_jobs import (
     scrape_simplify_jobs,
     scrape_simplify_jobs_sync,
 )
+from .links import (
+    JobCard,
+    extract_job_cards,
+    extract_job_links,
+    SELECTOLAX_AVAILABLE,
+)
+
+from ..dedup import (
+    SimHashIndex,
+    hamming_distance,
+    job_simhash,
+    simhash,
+)
 
 __all__ = [
     # Base scraper classes
@@ -47,4 +61,14 @@ __all__ = [
     "SimplifyJobsConfig",
     "scrape_simplify_jobs",
     "scrape_simplify_jobs_sync",
+    # Link extraction
+    "JobCard",
+    "extract_job_cards",
+    "extract_job_links",
+    "SELECTOLAX_AVAILABLE",
+    # De-duplication
+    "SimHashIndex",
+    "hamming_distance",
+    "job_simhash",
+    "simhash",
 ]
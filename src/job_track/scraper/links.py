@@ -0,0 +1,245 @@
+"""Job link extraction from career page HTML.
+
+Uses selectolax (lexbor) when installed, which is considerably faster than
+BeautifulSoup for CSS selection, and falls back to BeautifulSoup otherwise
+(with the lxml parser when that is installed).
+"""
+
+from typing import Iterator, NamedTuple, Optional, Sequence
+
+import soupsieve
+from bs4 import BeautifulSoup
+
+# selectolax is optional - fall back to BeautifulSoup if not installed
+try:
+    from selectolax.lexbor import LexborHTMLParser
+
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+# lxml is optional - BeautifulSoup uses its C-backed parser when installed,
+# which is several times faster than the pure-Python html.parser
+try:
+    import lxml  # noqa: F401
+
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# Parser name to pass to BeautifulSoup
+BS4_PARSER = "lxml" if LXML_AVAILABLE else "html.parser"
+
+# Selectors that commonly match job cards or job links on career pages
+JOB_LINK_SELECTORS = (
+    "[class*='job-card']", "[class*='job-listing']",
+    "a[href*='/jobs/']", "a[href*='/careers/']",
+)
+
+# Broader job card selectors for arbitrary career pages, fused into one
+# selector so the document is walked once
+JOB_CARD_SELECTOR = ", ".join((
+    "[class*='job-card']", "[class*='job-listing']", "[class*='posting']",
+    "li[class*='job']", "article[class*='job']", "div[class*='job'][class*='item']",
+    "a[href*='/jobs/']", "a[href*='/careers/']", "a[href*='/positions/']",
+))
+
+# Selector for the title element within a job card
+_TITLE_SELECTOR = "h2, h3, h4, [class*='title'], a"
+
+# Selector for the location element within a job card
+_LOCATION_SELECTOR = "[class*='location']"
+
+# Selector for a job card's link when the card is not a link itself
+_LINK_SELECTOR = "a[href]"
+
+# The per-card selectors run once for every card, so compile them up front
+# for the BeautifulSoup path (selectolax takes selector strings only)
+_TITLE_SIEVE = soupsieve.compile(_TITLE_SELECTOR)
+_LOCATION_SIEVE = soupsieve.compile(_LOCATION_SELECTOR)
+_LINK_SIEVE = soupsieve.compile(_LINK_SELECTOR)
+
+
+class JobCard(NamedTuple):
+    """A job found on a career page."""
+
+    title: str
+    href: str
+    location: Optional[str]
+    company: Optional[str] = None
+
+
+def _first_descendant(elem, selector: str):
+    """Return the first descendant of elem matching selector.
+
+    Unlike BeautifulSoup's select_one, selectolax can match elem itself.
+    """
+    for node in elem.css(selector):
+        if node.mem_id != elem.mem_id:
+            return node
+    return None
+
+
+def _extract_selectolax(html: str, selectors: Sequence[str], limit: int) -> Iterator[tuple[str, str]]:
+    tree = LexborHTMLParser(html)
+    for selector in selectors:
+        for elem in tree.css(selector)[:limit]:
+            title_elem = _first_descendant(elem, _TITLE_SELECTOR)
+            if title_elem is None:
+                continue
+            title = title_elem.text(strip=True)
+            if not title:
+                continue
+
+            link = elem.attributes.get("href") if elem.tag == "a" else None
+            if not link:
+                link_elem = _first_descendant(elem, _LINK_SELECTOR)
+                if link_elem is not None:
+                    link = link_elem.attributes.get("href")
+            if link:
+                yield title, link
+
+
+def _extract_bs4(html: str, selectors: Sequence[str], limit: int) -> Iterator[tuple[str, str]]:
+    soup = BeautifulSoup(html, BS4_PARSER)
+    for selector in selectors:
+        for elem in soupsieve.select(selector, soup, limit=limit):
+            title_elem = _TITLE_SIEVE.select_one(elem)
+            if not title_elem:
+                continue
+            title = title_elem.get_text(strip=True)
+            if not title:
+                continue
+
+            link = elem.get("href") if elem.name == "a" else None
+            if not link:
+                link_elem = _LINK_SIEVE.select_one(elem)
+                if link_elem:
+                    link = link_elem.get("href")
+            if link:
+                yield title, link
+
+
+def _cards_selectolax(
+    html: str,
+    selector: str,
+    min_title_length: int,
+    title_selector: str = _TITLE_SELECTOR,
+    company_selector: Optional[str] = None,
+) -> Iterator[JobCard]:
+    tree = LexborHTMLParser(html)
+    seen = set()
+    for elem in tree.css(selector):
+        # Read the link first: cards matched by several selectors are then
+        # skipped before any text is extracted
+        link = elem.attributes.get("href") if elem.tag == "a" else None
+        if not link:
+            link_elem = _first_descendant(elem, _LINK_SELECTOR)
+            if link_elem is not None:
+                link = link_elem.attributes.get("href")
+        if not link or link in seen:
+            continue
+
+        title_elem = _first_descendant(elem, title_selector)
+        if title_elem is None:
+            continue
+        title = title_elem.text(strip=True)
+        if len(title) < min_title_length:
+            continue
+
+        seen.add(link)
+        loc_elem = _first_descendant(elem, _LOCATION_SELECTOR)
+        company_elem = _first_descendant(elem, company_selector) if company_selector else None
+        yield JobCard(
+            title,
+            link,
+            loc_elem.text(strip=True) if loc_elem is not None else None,
+            company_elem.text(strip=True) if company_elem is not None else None,
+        )
+
+
+def _cards_bs4(
+    html: str,
+    selector: str,
+    min_title_length: int,
+    title_selector: str = _TITLE_SELECTOR,
+    company_selector: Optional[str] = None,
+) -> Iterator[JobCard]:
+    soup = BeautifulSoup(html, BS4_PARSER)
+    title_sieve = _TITLE_SIEVE if title_selector == _TITLE_SELECTOR else soupsieve.compile(title_selector)
+    company_sieve = soupsieve.compile(company_selector) if company_selector else None
+    seen = set()
+    for elem in soupsieve.select(selector, soup):
+        link = elem.get("href") if elem.name == "a" else None
+        if not link:
+            link_elem = _LINK_SIEVE.select_one(elem)
+            if link_elem:
+                link = link_elem.get("href")
+        if not link or link in seen:
+            continue
+
+        title_elem = title_sieve.select_one(elem)
+        if not title_elem:
+            continue
+        title = title_elem.get_text(strip=True)
+        if len(title) < min_title_length:
+            continue
+
+        seen.add(link)
+        loc_elem = _LOCATION_SIEVE.select_one(elem)
+        company_elem = company_sieve.select_one(elem) if company_sieve else None
+        yield JobCard(
+            title,
+            link,
+            loc_elem.get_text(strip=True) if loc_elem else None,
+            company_elem.get_text(strip=True) if company_elem else None,
+        )
+
+
+def extract_job_cards(
+    html: str,
+    selector: str = JOB_CARD_SELECTOR,
+    min_title_length: int = 1,
+    title_selector: str = _TITLE_SELECTOR,
+    company_selector: Optional[str] = None,
+) -> Iterator[JobCard]:
+    """Yield the jobs found on a career page, in document order.
+
+    Each href is yielded at most once, for the first card that has it.
+
+    Args:
+        html: Page HTML.
+        selector: CSS selector (possibly a selector list) for job cards.
+        min_title_length: Cards with shorter titles are skipped.
+        title_selector: CSS selector for the title element within a card.
+        company_selector: CSS selector for the company element within a
+            card; company is None when not given.
+
+    Yields:
+        JobCard tuples with the raw (possibly relative) href.
+    """
+    if SELECTOLAX_AVAILABLE:
+        yield from _cards_selectolax(html, selector, min_title_length, title_selector, company_selector)
+    else:
+        yield from _cards_bs4(html, selector, min_title_length, title_selector, company_selector)
+
+
+def extract_job_links(
+    html: str,
+    selectors: Sequence[str] = JOB_LINK_SELECTORS,
+    limit: int = 20,
+) -> Iterator[tuple[str, str]]:
+    """Yield (title, href) pairs for job links found in a page.
+
+    Args:
+        html: Page HTML.
+        selectors: CSS selectors for job cards or links, tried in order.
+        limit: Maximum elements to consider per selector.
+
+    Yields:
+        Tuples of link title text and raw (possibly relative) href.
+    """
+    if SELECTOLAX_AVAILABLE:
+        yield from _extract_selectolax(html, selectors, limit)
+    else:
+        yield from _extract_bs4(html, selectors, limit)
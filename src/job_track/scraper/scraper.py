@@ -12,6 +12,7 @@ from enum import Enum
 from typing import AsyncGenerator, Optional, Union
 from urllib.parse import urljoin, urlparse
 
+import soupsieve
 from bs4 import BeautifulSoup
 
 # Playwright is optional - may not be installed in all environments
@@ -22,6 +23,15 @@ try:
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
 
+# Selectors applied to every job container, compiled once rather than on
+# each select_one call
+_CONTAINER_TITLE_SIEVE = soupsieve.compile("h2, h3, h4, [class*='title'], [class*='Title'], a[class*='job']")
+_CONTAINER_LINK_SIEVE = soupsieve.compile("a[href]")
+_CONTAINER_LOCATION_SIEVE = soupsieve.compile("[class*='location'], [class*='Location']")
+_CONTAINER_DESCRIPTION_SIEVE = soupsieve.compile(
+    "[class*='description'], [class*='Description'], [class*='snippet']"
+)
+
 
 class ScrapeEventType(Enum):
     """Types of scrape events for streaming."""
@@ -350,9 +360,7 @@ class PlaywrightScraper(JobScraper):
         """Parse a single job container element."""
         # Find title
         title = None
-        title_elem = container.select_one(
-            "h2, h3, h4, [class*='title'], [class*='Title'], a[class*='job']"
-        )
+        title_elem = _CONTAINER_TITLE_SIEVE.select_one(container)
         if title_elem:
             title = self._clean_text(title_elem.get_text())
 
@@ -361,7 +369,7 @@ class PlaywrightScraper(JobScraper):
 
         # Find apply link
         apply_url = None
-        link = container.select_one("a[href]")
+        link = _CONTAINER_LINK_SIEVE.select_one(container)
         if link:
             href = link.get("href", "")
             apply_url = urljoin(source_url, href)
@@ -371,17 +379,13 @@ class PlaywrightScraper(JobScraper):
 
         # Find location
         location = None
-        location_elem = container.select_one(
-            "[class*='location'], [class*='Location']"
-        )
+        location_elem = _CONTAINER_LOCATION_SIEVE.select_one(container)
         if location_elem:
             location = self._clean_text(location_elem.get_text())
 
         # Find description/snippet
         description = None
-        desc_elem = container.select_one(
-            "[class*='description'], [class*='Description'], [class*='snippet']"
-        )
+        desc_elem = _CONTAINER_DESCRIPTION_SIEVE.select_one(container)
         if desc_elem:
             description = self._clean_text(desc_elem.get_text())
 
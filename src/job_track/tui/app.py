@@ -9,17 +9,32 @@ This provides a terminal-based user interface for:
 - Viewing application history
 """
 
+import argparse
+import asyncio
 import datetime
+import email.utils
+import hashlib
+import json
+import random
+import re
+import shutil
 import webbrowser
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Callable, NamedTuple, Optional
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
 
 import httpx
+from sqlalchemy import case, func, select, update
+from sqlalchemy.orm import load_only
 from textual import on, work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
+from textual.css.query import NoMatches, WrongType
 from textual.containers import Container, Grid, Horizontal, Vertical, VerticalScroll
+from textual.coordinate import Coordinate
 from textual.screen import ModalScreen, Screen
+from textual.timer import Timer
 from textual.widgets import (
     Button,
     DataTable,
@@ -35,13 +50,182 @@ from textual.widgets import (
     TabbedContent,
     TabPane,
 )
+from textual.widgets.data_table import RowKey
 from textual.widgets.option_list import Option
+from textual.worker import get_current_worker
 
-from job_track.db.models import Job, Profile, AppSettings, ScraperSource, get_resume_dir, get_session, init_db
+from job_track.db.debug import enable_query_debugging, get_query_log
+from job_track.db.models import (
+    JOB_SUMMARY_COLUMNS, Job, JobSummary, Profile, AppSettings, ScraperSource, get_db_path, get_resume_dir,
+    get_session, insert_new_jobs, job_search_filter, job_tag_filter,
+)
+from job_track.dedup import SimHashIndex, canonicalize_url
+from job_track.scraper.links import extract_job_cards, extract_job_links
 from job_track.scraper.simplify_jobs import SimplifyJobsScraper, SimplifyJobsConfig
 from job_track.scraper.hiring_cafe import HiringCafeScraper, SearchConfig, PLAYWRIGHT_AVAILABLE
 from job_track.scraper.scraper import ScrapeJobEvent, ScrapeProgressEvent, ScrapeCompleteEvent, ScrapeErrorEvent
 
+# HTTP/2 support for httpx is optional (the h2 package)
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# orjson is optional - fall back to the json module if not installed
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# ciso8601 is optional - fall back to datetime.fromisoformat if not installed
+try:
+    import ciso8601
+
+    CISO8601_AVAILABLE = True
+except ImportError:
+    CISO8601_AVAILABLE = False
+
+# Job table status column labels
+STATUS_APPLIED = "✓ Applied"
+STATUS_PENDING = "⏳ Pending"
+STATUS_COLUMN = "status"
+
+# Quiet period before filter/search changes reload the job list; typing
+# waits longer so a word costs one query rather than one per keystroke
+FILTER_DEBOUNCE_SECONDS = 0.15
+SEARCH_DEBOUNCE_SECONDS = 0.3
+
+# Most jobs shown in the job table at once
+MAX_VISIBLE_JOBS = 500
+
+# Job rows added to the table per refresh; the rest of a large update is
+# added over the following refreshes so the first rows paint sooner
+JOB_ROW_CHUNK = 50
+
+# Main tabs in display order, with lookups for h/l navigation
+TAB_ORDER = ("jobs-tab", "history-tab", "profiles-tab", "settings-tab")
+NEXT_TAB = {tab: TAB_ORDER[(i + 1) % len(TAB_ORDER)] for i, tab in enumerate(TAB_ORDER)}
+PREV_TAB = {tab: TAB_ORDER[(i - 1) % len(TAB_ORDER)] for i, tab in enumerate(TAB_ORDER)}
+
+# Limits for general career page scraping: bytes read from a page, and
+# jobs collected from it
+MAX_PAGE_BYTES = 2 * 1024 * 1024
+MAX_PAGE_JOBS = 200
+
+# Job card selectors for the hiring.cafe HTML search page, used when the
+# JSON API is unavailable
+HIRING_CAFE_CARD_SELECTOR = "[class*='job'], article, .posting"
+HIRING_CAFE_TITLE_SELECTOR = "h2, h3, [class*='title']"
+HIRING_CAFE_COMPANY_SELECTOR = "[class*='company']"
+
+# hiring.cafe search API, the jobs requested per page, the pages fetched per
+# search and how many of those requests may be in flight at once
+HIRING_CAFE_API_URL = "https://hiring.cafe/api/jobs"
+HIRING_CAFE_PAGE_SIZE = 100
+HIRING_CAFE_SEARCH_PAGES = 5
+HIRING_CAFE_CONCURRENCY = 4
+
+# Keys API responses use for the same job field, in order of preference
+HIRING_CAFE_TITLE_KEYS = ("title", "job_title")
+HIRING_CAFE_COMPANY_KEYS = ("company", "company_name")
+HIRING_CAFE_URL_KEYS = ("url", "apply_url", "link")
+LEVER_URL_KEYS = ("hostedUrl", "applyUrl")
+
+# Statuses and transport errors that are retried with backoff, the attempts
+# made per request, the longest wait between attempts and the most time spent
+# waiting across all attempts (seconds). Read timeouts are not retried: each
+# already costs the client's full timeout.
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+RETRY_TRANSPORT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout)
+HTTP_RETRY_ATTEMPTS = 5
+MAX_RETRY_DELAY = 30.0
+MAX_RETRY_WAIT = 60.0
+
+# Columns loaded for each application in the history tab
+HISTORY_COLUMNS = (Job.id, Job.title, Job.company, Job.apply_url, Job.applied_at, Job.profile_id)
+
+# Applications loaded per history page, and how close to the end of the
+# loaded rows the cursor gets before the next page is fetched
+HISTORY_PAGE_SIZE = 200
+HISTORY_PREFETCH_ROWS = 20
+
+
+def _job_status(job: JobSummary) -> str:
+    """Return the status column label for a job summary."""
+    return STATUS_APPLIED if job.is_applied else STATUS_PENDING if job.is_pending else ""
+
+
+def _job_table_row(job: JobSummary) -> tuple:
+    """Build the job table cells for a job summary."""
+    return (
+        job.company[:25],
+        job.title[:40],
+        (job.location or "")[:20],
+        ", ".join(job.tags)[:20],
+        _job_status(job),
+    )
+
+
+class JobFilters(NamedTuple):
+    """Search term and filter switch settings for the job table."""
+
+    search: str
+    new_grad: bool
+    applied: bool
+    pending: bool
+
+    def matches(self, job: JobSummary) -> bool:
+        """Return whether a job passes the filter switches."""
+        return (
+            job.is_applied == self.applied
+            and (not self.new_grad or "new-grad" in job.tags)
+            and (not self.pending or job.is_pending)
+        )
+
+
+class ProfileChoice(NamedTuple):
+    """Profile fields shown by the profile pickers."""
+
+    id: str
+    profile_name: str
+    full_name: str
+    latest_resume_name: Optional[str]
+
+
+@lru_cache(maxsize=1)
+def _list_profile_choices() -> tuple[ProfileChoice, ...]:
+    """Load the profiles offered by the profile pickers.
+
+    Shared across modals; JobTrackApp.refresh_profiles clears the cache
+    whenever profiles change.
+    """
+    session = get_session()
+    try:
+        # Read the latest resume name in SQL rather than parsing each
+        # profile's version list. The path indexes from json_array_length
+        # since '$[#-1]' needs SQLite 3.31+; versions saved without a name
+        # show as 'N/A', and profiles with no resumes get NULL.
+        resume_versions = func.nullif(Profile.resume_versions, "")
+        last_index = func.json_array_length(resume_versions) - 1
+        latest_resume_column = case((
+            last_index >= 0,
+            func.coalesce(func.json_extract(resume_versions, func.printf("$[%d].name", last_index)), "N/A"),
+        ))
+        rows = session.query(
+            Profile.id, Profile.profile_name, Profile.first_name, Profile.last_name, latest_resume_column
+        ).all()
+    finally:
+        session.close()
+
+    return tuple(
+        ProfileChoice(profile_id, profile_name, f"{first_name} {last_name}".strip(), latest_name)
+        for profile_id, profile_name, first_name, last_name, latest_name in rows
+    )
+
 
 # ============================================================================
 # Modal Screens
@@ -172,8 +356,8 @@ class JobDetailScreen(ModalScreen[None]):
                 yield Label(self.job.get("apply_url", "N/A"), classes="detail-value")
 
                 yield Label("Description:", classes="detail-label")
-                desc = self.job.get("description") or "No description available"
-                yield Label(desc[:2000] if len(desc) > 2000 else desc, classes="detail-value")
+                desc = (self.job.get("description") or "No description available")[:2000]
+                yield Label(desc, classes="detail-value")
 
             with Horizontal(id="detail-buttons"):
                 yield Button("Open Link", id="open-link", variant="primary")
@@ -184,7 +368,7 @@ class JobDetailScreen(ModalScreen[None]):
         """Open the job link in browser."""
         url = self.job.get("apply_url")
         if url:
-            webbrowser.open(url)
+            self.app.open_in_browser(url)
 
     @on(Button.Pressed, "#close")
     def close_dialog(self) -> None:
@@ -240,24 +424,19 @@ class ProfileSelectScreen(ModalScreen[Optional[str]]):
         with Vertical(id="profile-container"):
             yield Label("Select Profile for Application", id="profile-title")
             with VerticalScroll(id="profile-list"):
-                session = get_session()
-                try:
-                    profiles = session.query(Profile).all()
-                    if profiles:
-                        for profile in profiles:
-                            resume_info = ""
-                            latest = profile.get_latest_resume_version()
-                            if latest:
-                                resume_info = f" - Resume: {latest.get('name', 'N/A')}"
-                            yield Button(
-                                f"{profile.profile_name} ({profile.get_full_name()}){resume_info}",
-                                id=f"profile-{profile.id}",
-                                classes="profile-btn",
-                            )
-                    else:
-                        yield Label("No profiles found. Create one first!")
-                finally:
-                    session.close()
+                profiles = _list_profile_choices()
+                if profiles:
+                    for profile in profiles:
+                        resume_info = ""
+                        if profile.latest_resume_name is not None:
+                            resume_info = f" - Resume: {profile.latest_resume_name}"
+                        yield Button(
+                            f"{profile.profile_name} ({profile.full_name}){resume_info}",
+                            id=f"profile-{profile.id}",
+                            classes="profile-btn",
+                        )
+                else:
+                    yield Label("No profiles found. Create one first!")
             with Horizontal(id="profile-buttons"):
                 yield Button("Cancel", id="cancel", variant="default")
 
@@ -275,6 +454,14 @@ class ProfileSelectScreen(ModalScreen[Optional[str]]):
         self.dismiss(None)
 
 
+# Profile columns edited by ProfileEditScreen
+_PROFILE_FIELDS = (
+    "profile_name", "first_name", "last_name", "email", "phone",
+    "address_street", "address_city", "address_state", "address_zip", "address_country",
+    "linkedin_url", "github_url", "portfolio_url",
+)
+
+
 class ProfileEditScreen(ModalScreen[bool]):
     """Modal screen for creating or editing a profile."""
 
@@ -321,17 +508,24 @@ class ProfileEditScreen(ModalScreen[bool]):
         """Initialize with optional profile ID for editing."""
         super().__init__()
         self.profile_id = profile_id
-        self.profile: Optional[Profile] = None
+        # Plain snapshot of the edited fields, taken before the session
+        # closes so nothing can lazy-load from a detached instance
+        self.profile_values: Optional[dict[str, str]] = None
         if profile_id:
             session = get_session()
             try:
-                self.profile = session.query(Profile).filter(Profile.id == profile_id).first()
+                profile = session.get(
+                    Profile, profile_id, options=[load_only(*(getattr(Profile, f) for f in _PROFILE_FIELDS))]
+                )
+                if profile:
+                    self.profile_values = {field: getattr(profile, field) or "" for field in _PROFILE_FIELDS}
             finally:
                 session.close()
 
     def compose(self) -> ComposeResult:
         """Create child widgets."""
-        title = "Edit Profile" if self.profile else "Add New Profile"
+        title = "Edit Profile" if self.profile_values else "Add New Profile"
+        values = self.profile_values or dict.fromkeys(_PROFILE_FIELDS, "")
         with Vertical(id="edit-profile-container"):
             yield Label(title, id="edit-title")
             with VerticalScroll(id="edit-profile-scroll"):
@@ -341,7 +535,7 @@ class ProfileEditScreen(ModalScreen[bool]):
                 yield Input(
                     id="profile-name-input",
                     placeholder="e.g., Tech Resume, Finance Applications",
-                    value=self.profile.profile_name if self.profile else "",
+                    value=values["profile_name"],
                 )
                 
                 # Basic Info
@@ -350,25 +544,25 @@ class ProfileEditScreen(ModalScreen[bool]):
                 yield Input(
                     id="first-name-input",
                     placeholder="First Name",
-                    value=self.profile.first_name if self.profile else "",
+                    value=values["first_name"],
                 )
                 yield Label("Last Name:", classes="field-label")
                 yield Input(
                     id="last-name-input",
                     placeholder="Last Name",
-                    value=self.profile.last_name if self.profile else "",
+                    value=values["last_name"],
                 )
                 yield Label("Email:", classes="field-label")
                 yield Input(
                     id="email-input",
                     placeholder="email@example.com",
-                    value=self.profile.email if self.profile else "",
+                    value=values["email"],
                 )
                 yield Label("Phone:", classes="field-label")
                 yield Input(
                     id="phone-input",
                     placeholder="+1-555-555-5555",
-                    value=self.profile.phone if self.profile and self.profile.phone else "",
+                    value=values["phone"],
                 )
 
                 # Address
@@ -377,31 +571,31 @@ class ProfileEditScreen(ModalScreen[bool]):
                 yield Input(
                     id="street-input",
                     placeholder="123 Main St",
-                    value=self.profile.address_street if self.profile and self.profile.address_street else "",
+                    value=values["address_street"],
                 )
                 yield Label("City:", classes="field-label")
                 yield Input(
                     id="city-input",
                     placeholder="City",
-                    value=self.profile.address_city if self.profile and self.profile.address_city else "",
+                    value=values["address_city"],
                 )
                 yield Label("State/Province:", classes="field-label")
                 yield Input(
                     id="state-input",
                     placeholder="State",
-                    value=self.profile.address_state if self.profile and self.profile.address_state else "",
+                    value=values["address_state"],
                 )
                 yield Label("ZIP/Postal Code:", classes="field-label")
                 yield Input(
                     id="zip-input",
                     placeholder="12345",
-                    value=self.profile.address_zip if self.profile and self.profile.address_zip else "",
+                    value=values["address_zip"],
                 )
                 yield Label("Country:", classes="field-label")
                 yield Input(
                     id="country-input",
                     placeholder="USA",
-                    value=self.profile.address_country if self.profile and self.profile.address_country else "",
+                    value=values["address_country"],
                 )
 
                 # URLs
@@ -410,19 +604,19 @@ class ProfileEditScreen(ModalScreen[bool]):
                 yield Input(
                     id="linkedin-input",
                     placeholder="https://linkedin.com/in/...",
-                    value=self.profile.linkedin_url if self.profile and self.profile.linkedin_url else "",
+                    value=values["linkedin_url"],
                 )
                 yield Label("GitHub URL:", classes="field-label")
                 yield Input(
                     id="github-input",
                     placeholder="https://github.com/...",
-                    value=self.profile.github_url if self.profile and self.profile.github_url else "",
+                    value=values["github_url"],
                 )
                 yield Label("Portfolio URL:", classes="field-label")
                 yield Input(
                     id="portfolio-input",
                     placeholder="https://portfolio.com",
-                    value=self.profile.portfolio_url if self.profile and self.profile.portfolio_url else "",
+                    value=values["portfolio_url"],
                 )
 
             with Horizontal(id="edit-profile-buttons"):
@@ -452,7 +646,7 @@ class ProfileEditScreen(ModalScreen[bool]):
         session = get_session()
         try:
             if self.profile_id:
-                profile = session.query(Profile).filter(Profile.id == self.profile_id).first()
+                profile = session.get(Profile, self.profile_id)
                 if profile:
                     profile.profile_name = profile_name
                     profile.first_name = first_name
@@ -500,6 +694,15 @@ class ProfileEditScreen(ModalScreen[bool]):
         self.dismiss(False)
 
 
+def _file_sha256(path: Path) -> str:
+    """Return the SHA-256 hex digest of a file, reading it in 1 MiB chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
 class ResumeUploadScreen(ModalScreen[bool]):
     """Modal screen for uploading a resume."""
 
@@ -558,9 +761,6 @@ class ResumeUploadScreen(ModalScreen[bool]):
     @on(Button.Pressed, "#upload")
     def upload_resume(self) -> None:
         """Upload the resume file."""
-        import shutil
-        import uuid
-
         filepath = self.query_one("#filepath-input", Input).value.strip()
         name = self.query_one("#name-input", Input).value.strip() or None
 
@@ -571,29 +771,62 @@ class ResumeUploadScreen(ModalScreen[bool]):
         if not source_path.exists():
             return
 
+        self.query_one("#upload", Button).disabled = True
+        self.query_one("#resume-info", Label).update("Copying...")
+        self._copy_resume(source_path, name)
+
+    @work(thread=True, exclusive=True, group="resume-upload")
+    def _copy_resume(self, source_path: Path, name: Optional[str]) -> None:
+        """Copy the resume and record the new version off the UI thread."""
         session = get_session()
         try:
-            profile = session.query(Profile).filter(Profile.id == self.profile_id).first()
+            profile = session.get(Profile, self.profile_id)
             if not profile:
+                self.app.call_from_thread(self._upload_failed, "Profile not found.")
                 return
 
             # Create resume directory
             resume_dir = get_resume_dir(self.profile_id)
-            
-            # Generate filename
-            filename = f"resume_{uuid.uuid4().hex[:8]}.pdf"
-            dest_path = resume_dir / filename
-            
-            # Copy file
-            shutil.copy2(source_path, dest_path)
+
+            try:
+                # Reuse the stored copy of an identical file rather than
+                # copying it again
+                sha256 = _file_sha256(source_path)
+                filename = None
+                for version in profile.get_resume_versions():
+                    if version.get("sha256") == sha256 and (resume_dir / version["filename"]).exists():
+                        filename = version["filename"]
+                        break
+
+                if filename is None:
+                    # Name the copy after its content so identical files
+                    # share one copy
+                    filename = f"resume_{sha256[:16]}.pdf"
+                    dest_path = resume_dir / filename
+                    if not dest_path.exists():
+                        shutil.copyfile(source_path, dest_path)
+                elif name is None:
+                    # An unnamed re-upload of a stored resume adds nothing
+                    self.app.call_from_thread(self._upload_failed, "This resume is already uploaded.")
+                    return
+            except OSError as e:
+                # An unreadable source or a full disk is reported on the
+                # form rather than ending the app
+                self.app.call_from_thread(self._upload_failed, f"Could not copy resume: {e.strerror or e}")
+                return
             
             # Update profile
-            profile.add_resume_version(filename, name)
+            profile.add_resume_version(filename, name, sha256=sha256)
             session.commit()
         finally:
             session.close()
 
-        self.dismiss(True)
+        self.app.call_from_thread(self.dismiss, True)
+
+    def _upload_failed(self, message: str) -> None:
+        """Re-enable the form after an upload that was not recorded."""
+        self.query_one("#upload", Button).disabled = False
+        self.query_one("#resume-info", Label).update(message)
 
     @on(Button.Pressed, "#cancel")
     def cancel(self) -> None:
@@ -605,6 +838,155 @@ class ResumeUploadScreen(ModalScreen[bool]):
         self.dismiss(False)
 
 
+def _parse_json(content: bytes | str):
+    """Parse a JSON response body, using orjson when it is installed.
+
+    Raises json.JSONDecodeError on invalid input either way (orjson's error
+    is a subclass of it).
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _lever_api_url(url: str) -> str:
+    """Return the JSON postings URL for a Lever job board URL.
+
+    ``mode=json`` is added to any query parameters already on the URL
+    rather than appended after them. URLs ending in ``/api`` are used as is.
+    A posting's ``/apply`` form URL is mapped to the company's board.
+    """
+    parts = urlsplit(url.strip())
+    path = parts.path.rstrip("/")
+    if path.endswith("/apply"):
+        path = path[:-len("/apply")].rsplit("/", 1)[0]
+    if path.endswith("/api"):
+        return urlunsplit(parts._replace(path=path))
+    query = [(key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True) if key != "mode"]
+    query.append(("mode", "json"))
+    return urlunsplit(parts._replace(path=path, query=urlencode(query), fragment=""))
+
+
+def _parse_posted_at(value) -> Optional[datetime.datetime]:
+    """Parse a posting date, returning None if it is not one.
+
+    Accepts ISO 8601 strings and epoch timestamps in milliseconds, which
+    are returned in UTC.
+    """
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        try:
+            return datetime.datetime.fromtimestamp(value / 1000, datetime.timezone.utc)
+        except (OverflowError, OSError, ValueError):
+            return None
+    if not isinstance(value, str):
+        return None
+    try:
+        if CISO8601_AVAILABLE:
+            return ciso8601.parse_datetime(value)
+        # fromisoformat only accepts a trailing Z from Python 3.11
+        if value.endswith("Z"):
+            value = value[:-1] + "+00:00"
+        return datetime.datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def _first_present(item: dict, keys: tuple[str, ...], default=None):
+    """Return the value of the first of keys present in item, else default.
+
+    Equivalent to nested ``item.get(a, item.get(b, default))`` calls, but
+    stops at the first key found instead of evaluating every fallback.
+    """
+    for key in keys:
+        if key in item:
+            return item[key]
+    return default
+
+
+def _hiring_cafe_items(data) -> list:
+    """Return the job items from a hiring.cafe API response body."""
+    if isinstance(data, list):
+        return data
+    return list(data.get("jobs", data.get("results", [])))
+
+
+def _retry_delay(response: Optional[httpx.Response], attempt: int) -> float:
+    """Seconds to wait before retrying a request.
+
+    Honors a Retry-After header given in seconds or as an HTTP date, and
+    otherwise backs off exponentially with jitter.
+    """
+    retry_after = response.headers.get("Retry-After") if response is not None else None
+    if retry_after:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            try:
+                when = email.utils.parsedate_to_datetime(retry_after)
+                delay = (when - datetime.datetime.now(datetime.timezone.utc)).total_seconds()
+            except (TypeError, ValueError):
+                delay = None
+        if delay is not None:
+            return min(MAX_RETRY_DELAY, max(0.0, delay))
+    return min(MAX_RETRY_DELAY, 2 ** attempt + random.random())
+
+
+async def _get_with_retry(
+    client: httpx.AsyncClient, url: str, attempts: int = HTTP_RETRY_ATTEMPTS, **kwargs
+) -> httpx.Response:
+    """GET a URL, retrying rate limited, unavailable and unreachable requests.
+
+    Gives up once attempts are used up or the next wait would take the
+    total time spent waiting past MAX_RETRY_WAIT.
+
+    Returns:
+        The first response with a non-retryable status, or the last
+        response when giving up.
+
+    Raises:
+        httpx.TransportError: If the last attempt fails to connect, or
+            any attempt fails in a way that is not retried (such as a
+            read timeout).
+    """
+    waited = 0.0
+    for attempt in range(attempts):
+        response = error = None
+        try:
+            response = await client.get(url, **kwargs)
+        except RETRY_TRANSPORT_ERRORS as e:
+            error = e
+        else:
+            if response.status_code not in RETRY_STATUS_CODES:
+                return response
+        delay = _retry_delay(response, attempt)
+        if attempt == attempts - 1 or waited + delay > MAX_RETRY_WAIT:
+            break
+        waited += delay
+        await asyncio.sleep(delay)
+    if error is not None:
+        raise error
+    return response
+
+
+async def _fetch_page_text(client: httpx.AsyncClient, url: str, max_bytes: int = MAX_PAGE_BYTES) -> str:
+    """Download a page, reading at most max_bytes of the body.
+
+    The body is streamed so oversized pages stop downloading at the limit
+    instead of being buffered whole; HTML parsers accept the truncated tail.
+    """
+    chunks = []
+    size = 0
+    async with client.stream("GET", url) as response:
+        response.raise_for_status()
+        async for chunk in response.aiter_bytes():
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= max_bytes:
+                break
+        encoding = response.charset_encoding or "utf-8"
+    return b"".join(chunks).decode(encoding, errors="replace")
+
+
 class ScrapeScreen(ModalScreen[bool]):
     """Modal screen for scraping jobs from a URL."""
 
@@ -673,9 +1055,28 @@ class ScrapeScreen(ModalScreen[bool]):
                 yield Button("Scrape", id="scrape", variant="success")
                 yield Button("Cancel", id="cancel", variant="default")
 
+    # Latest status message not yet written to the screen
+    _pending_status: Optional[str] = None
+
+    @cached_property
+    def _status_label(self) -> Label:
+        return self.query_one("#scrape-status", Label)
+
     def update_status(self, message: str) -> None:
-        """Update status message."""
-        self.query_one("#scrape-status", Label).update(message)
+        """Update status message.
+
+        Updates are coalesced: only the latest message is written, once
+        per refresh, however many arrive in between.
+        """
+        if self._pending_status is None:
+            self.call_after_refresh(self._flush_status)
+        self._pending_status = message
+
+    def _flush_status(self) -> None:
+        """Write the pending status message."""
+        message, self._pending_status = self._pending_status, None
+        if message is not None and self.is_attached:
+            self._status_label.update(message)
 
     @on(Button.Pressed, "#scrape")
     async def do_scrape(self) -> None:
@@ -696,122 +1097,97 @@ class ScrapeScreen(ModalScreen[bool]):
             else:
                 jobs = await self._scrape_general(url, company)
             
-            # Save jobs to database
-            session = get_session()
-            try:
-                added = 0
-                for job_data in jobs:
-                    existing = session.query(Job).filter(Job.apply_url == job_data["apply_url"]).first()
-                    if existing:
-                        continue
-                    job = Job(
-                        title=job_data["title"],
-                        company=job_data["company"],
-                        location=job_data.get("location"),
-                        description=job_data.get("description"),
-                        apply_url=job_data["apply_url"],
-                        source_url=url,
-                    )
-                    if job_data.get("tags"):
-                        job.set_tags(job_data["tags"])
-                    session.add(job)
-                    added += 1
-                session.commit()
-                self.update_status(f"Success! Added {added} new jobs.")
-            finally:
-                session.close()
+            # Save jobs to database without blocking the event loop
+            added = await asyncio.to_thread(self._save_jobs, jobs, url)
+            self.update_status(f"Success! Added {added} new jobs.")
         except Exception as e:
             self.update_status(f"Error: {str(e)[:50]}")
 
+    def _save_jobs(self, jobs: list[dict], source_url: str) -> int:
+        """Save scraped jobs to database, return count of newly added."""
+        session = get_session()
+        try:
+            added = insert_new_jobs(session, [
+                {
+                    "title": job_data["title"],
+                    "company": job_data["company"],
+                    "location": job_data.get("location"),
+                    "description": job_data.get("description"),
+                    "apply_url": job_data["apply_url"],
+                    "source_url": source_url,
+                    "tags": job_data.get("tags") or [],
+                }
+                for job_data in jobs
+            ])
+            session.commit()
+        finally:
+            session.close()
+        return added
+
     async def _scrape_lever(self, url: str, company: str) -> list[dict]:
-        """Scrape jobs from a Lever job board."""
+        """Scrape jobs from a Lever job board.
+
+        The page is fetched for general HTML parsing while the Lever API
+        request is in flight and is only used if the API request fails; the
+        page fetch is cancelled as soon as the API answers.
+        """
+        general = asyncio.create_task(self._scrape_general(url, company))
+        try:
+            jobs = await self._scrape_lever_api(url, company)
+        except Exception:
+            return await general
+        general.cancel()
+        # Retrieve any error so it is not reported as never retrieved
+        general.add_done_callback(lambda task: task.cancelled() or task.exception())
+        return jobs
+
+    async def _scrape_lever_api(self, url: str, company: str) -> list[dict]:
+        """Fetch jobs from the Lever postings API, raising on failure."""
         jobs = []
-        async with httpx.AsyncClient(timeout=30, follow_redirects=True) as client:
-            api_url = url.rstrip("/")
-            if not api_url.endswith("/api"):
-                api_url = api_url + "?mode=json"
-            
-            try:
-                response = await client.get(api_url)
-                response.raise_for_status()
-                
-                try:
-                    data = response.json()
-                    if isinstance(data, list):
-                        for item in data:
-                            jobs.append({
-                                "title": item.get("text", "Unknown Title"),
-                                "company": company,
-                                "location": item.get("categories", {}).get("location", ""),
-                                "description": item.get("descriptionPlain", ""),
-                                "apply_url": item.get("hostedUrl", item.get("applyUrl", url)),
-                                "tags": [],
-                            })
-                except:
-                    return await self._scrape_general(url, company)
-            except:
-                return await self._scrape_general(url, company)
-        
+        client = self.app.http_client
+        response = await client.get(_lever_api_url(url))
+        response.raise_for_status()
+        data = _parse_json(response.content)
+
+        if isinstance(data, list):
+            for item in data:
+                jobs.append({
+                    "title": item.get("text", "Unknown Title"),
+                    "company": company,
+                    "location": item.get("categories", {}).get("location", ""),
+                    "description": item.get("descriptionPlain", ""),
+                    "apply_url": _first_present(item, LEVER_URL_KEYS, url),
+                    "tags": [],
+                })
         return jobs
 
     async def _scrape_general(self, url: str, company: str) -> list[dict]:
         """Scrape jobs using general HTML parsing."""
-        from urllib.parse import urljoin
-        from bs4 import BeautifulSoup
-        
         jobs = []
-        async with httpx.AsyncClient(timeout=30, follow_redirects=True) as client:
-            response = await client.get(url)
-            response.raise_for_status()
+        client = self.app.http_client
+        html = await _fetch_page_text(client, url)
+        
+        seen_urls = set()
+        for title, link, location, _ in extract_job_cards(html, min_title_length=3):
+            if len(jobs) >= MAX_PAGE_JOBS:
+                break
             
-            soup = BeautifulSoup(response.text, "html.parser")
+            if link.startswith("/"):
+                link = urljoin(url, link)
             
-            job_selectors = [
-                "[class*='job-card']", "[class*='job-listing']", "[class*='posting']",
-                "li[class*='job']", "article[class*='job']", "div[class*='job'][class*='item']",
-                "a[href*='/jobs/']", "a[href*='/careers/']", "a[href*='/positions/']",
-            ]
-            
-            seen_urls = set()
-            for selector in job_selectors:
-                for elem in soup.select(selector):
-                    title_elem = elem.select_one("h2, h3, h4, [class*='title'], a")
-                    if not title_elem:
-                        continue
-                    title = title_elem.get_text(strip=True)
-                    if not title or len(title) < 3:
-                        continue
-                    
-                    link = elem.get("href") if elem.name == "a" else None
-                    if not link:
-                        link_elem = elem.select_one("a[href]")
-                        if link_elem:
-                            link = link_elem.get("href")
-                    
-                    if not link:
-                        continue
-                    
-                    if link.startswith("/"):
-                        link = urljoin(url, link)
-                    
-                    if link in seen_urls:
-                        continue
-                    seen_urls.add(link)
-                    
-                    location = None
-                    loc_elem = elem.select_one("[class*='location']")
-                    if loc_elem:
-                        location = loc_elem.get_text(strip=True)
-                    
-                    jobs.append({
-                        "title": title[:200],
-                        "company": company,
-                        "location": location,
-                        "description": None,
-                        "apply_url": link,
-                        "tags": [],
-                    })
+            if link in seen_urls:
+                continue
+            seen_urls.add(link)
             
+            jobs.append({
+                "title": title[:200],
+                "company": company,
+                "location": location,
+                "description": None,
+                "apply_url": link,
+                "tags": [],
+            })
+        
         return jobs
 
     @on(Button.Pressed, "#cancel")
@@ -824,8 +1200,11 @@ class ScrapeScreen(ModalScreen[bool]):
         self.dismiss(False)
 
 
-class AddApplicationScreen(ModalScreen[bool]):
-    """Modal screen for manually adding a job application."""
+class AddApplicationScreen(ModalScreen[Optional[str]]):
+    """Modal screen for manually adding a job application.
+
+    Dismisses with the id of the applied job, or None if cancelled.
+    """
 
     CSS = """
     AddApplicationScreen {
@@ -864,15 +1243,11 @@ class AddApplicationScreen(ModalScreen[bool]):
     def __init__(self) -> None:
         """Initialize."""
         super().__init__()
-        self.profiles: list[Profile] = []
+        self.profiles: tuple[ProfileChoice, ...] = ()
 
     def compose(self) -> ComposeResult:
         """Create child widgets."""
-        session = get_session()
-        try:
-            self.profiles = list(session.query(Profile).all())
-        finally:
-            session.close()
+        self.profiles = _list_profile_choices()
 
         profile_options = [(p.profile_name, p.id) for p in self.profiles]
         if not profile_options:
@@ -912,32 +1287,46 @@ class AddApplicationScreen(ModalScreen[bool]):
         if not company or not title or not url:
             return
 
+        applied = {
+            "is_applied": True,
+            "is_pending": False,
+            "applied_at": datetime.datetime.now(),
+            "profile_id": profile_id if profile_id else None,
+        }
         session = get_session()
         try:
-            job = Job(
-                title=title,
-                company=company,
-                location=location if location else None,
-                apply_url=url,
-                is_applied=True,
-                applied_at=datetime.datetime.now(),
-                profile_id=profile_id if profile_id else None,
+            # Mark an already-listed posting as applied instead of adding
+            # a duplicate row for it
+            job_id = session.scalar(
+                select(Job.id).where(Job.canonical_url == canonicalize_url(url)).limit(1)
             )
-            session.add(job)
+            if job_id:
+                session.execute(update(Job).where(Job.id == job_id).values(**applied))
+            else:
+                job = Job(
+                    title=title,
+                    company=company,
+                    location=location if location else None,
+                    apply_url=url,
+                    **applied,
+                )
+                session.add(job)
+                session.flush()
+                job_id = job.id
             session.commit()
         finally:
             session.close()
 
-        self.dismiss(True)
+        self.dismiss(job_id)
 
     @on(Button.Pressed, "#cancel")
     def cancel(self) -> None:
         """Cancel and close."""
-        self.dismiss(False)
+        self.dismiss(None)
 
     def key_escape(self) -> None:
         """Handle escape key."""
-        self.dismiss(False)
+        self.dismiss(None)
 
 
 class HiringCafeSearchScreen(ModalScreen[bool]):
@@ -997,16 +1386,32 @@ class HiringCafeSearchScreen(ModalScreen[bool]):
                 yield Button("Search & Import", id="search", variant="success")
                 yield Button("Cancel", id="cancel", variant="default")
 
+    @cached_property
+    def _query_input(self) -> Input:
+        return self.query_one("#query-input", Input)
+
+    @cached_property
+    def _location_input(self) -> Input:
+        return self.query_one("#location-input", Input)
+
+    @cached_property
+    def _days_input(self) -> Input:
+        return self.query_one("#days-input", Input)
+
+    @cached_property
+    def _status_label(self) -> Label:
+        return self.query_one("#search-status", Label)
+
     def update_status(self, message: str) -> None:
         """Update status message."""
-        self.query_one("#search-status", Label).update(message)
+        self._status_label.update(message)
 
     @on(Button.Pressed, "#search")
     async def do_search(self) -> None:
         """Perform the search."""
-        query = self.query_one("#query-input", Input).value.strip()
-        location = self.query_one("#location-input", Input).value.strip()
-        days_str = self.query_one("#days-input", Input).value.strip()
+        query = self._query_input.value.strip()
+        location = self._location_input.value.strip()
+        days_str = self._days_input.value.strip()
         
         try:
             max_days = int(days_str) if days_str else 90
@@ -1021,98 +1426,112 @@ class HiringCafeSearchScreen(ModalScreen[bool]):
         
         try:
             jobs = await self._search_hiring_cafe(query, location, max_days)
-            
-            session = get_session()
-            try:
-                added = 0
-                cutoff_date = datetime.datetime.now() - datetime.timedelta(days=max_days)
-                
-                for job_data in jobs:
-                    posted_at = job_data.get("posted_at")
-                    if posted_at and posted_at < cutoff_date:
-                        continue
-                    
-                    existing = session.query(Job).filter(Job.apply_url == job_data["apply_url"]).first()
-                    if existing:
-                        continue
-                    
-                    job = Job(
-                        title=job_data["title"],
-                        company=job_data["company"],
-                        location=job_data.get("location"),
-                        description=job_data.get("description"),
-                        apply_url=job_data["apply_url"],
-                        source_url="hiring.cafe",
-                    )
-                    if job_data.get("tags"):
-                        job.set_tags(job_data["tags"])
-                    session.add(job)
-                    added += 1
-                session.commit()
-                self.update_status(f"Success! Added {added} new jobs.")
-            finally:
-                session.close()
+            self.update_status(f"Saving {len(jobs)} jobs...")
+            added = await asyncio.to_thread(self._save_jobs, jobs)
+            self.update_status(f"Success! Added {added} new jobs.")
         except Exception as e:
             self.update_status(f"Error: {str(e)[:50]}")
 
-    async def _search_hiring_cafe(self, query: str, location: str, max_days: int) -> list[dict]:
-        """Search hiring.cafe API for jobs."""
-        from bs4 import BeautifulSoup
+    def _save_jobs(self, jobs: list[dict]) -> int:
+        """Save found jobs to database, return count of newly added."""
+        session = get_session()
+        try:
+            added = insert_new_jobs(session, [
+                {
+                    "title": job_data["title"],
+                    "company": job_data["company"],
+                    "location": job_data.get("location"),
+                    "description": job_data.get("description"),
+                    "apply_url": job_data["apply_url"],
+                    "source_url": "hiring.cafe",
+                    "tags": job_data.get("tags") or [],
+                }
+                for job_data in jobs
+            ])
+            session.commit()
+        finally:
+            session.close()
+        return added
+
+    async def _search_hiring_cafe(
+        self, query: str, location: str, max_days: int, pages: int = HIRING_CAFE_SEARCH_PAGES
+    ) -> list[dict]:
+        """Search hiring.cafe API for jobs posted within the last max_days.
+
+        The first page is fetched alone; if it is full, the remaining pages
+        (up to pages in total) are fetched concurrently.
+        """
         jobs = []
         
-        async with httpx.AsyncClient(timeout=30, follow_redirects=True) as client:
-            params = {"q": query, "limit": 100}
-            if location:
-                params["location"] = location
+        client = self.app.http_client
+        params = {"q": query, "limit": HIRING_CAFE_PAGE_SIZE}
+        if location:
+            params["location"] = location
+        
+        try:
+            response = await _get_with_retry(client, HIRING_CAFE_API_URL, params=params)
             
-            try:
-                response = await client.get("https://hiring.cafe/api/jobs", params=params)
+            if response.status_code == 200:
+                items = _hiring_cafe_items(_parse_json(response.content))
+                if len(items) >= HIRING_CAFE_PAGE_SIZE and pages > 1:
+                    semaphore = asyncio.Semaphore(HIRING_CAFE_CONCURRENCY)
+
+                    async def fetch_page(page: int) -> httpx.Response:
+                        async with semaphore:
+                            return await _get_with_retry(
+                                client, HIRING_CAFE_API_URL, params={**params, "offset": page * HIRING_CAFE_PAGE_SIZE}
+                            )
+
+                    responses = await asyncio.gather(
+                        *(fetch_page(page) for page in range(1, pages)), return_exceptions=True
+                    )
+                    # A failed later page only loses that page's jobs
+                    for page_response in responses:
+                        if isinstance(page_response, httpx.Response) and page_response.status_code == 200:
+                            items.extend(_hiring_cafe_items(_parse_json(page_response.content)))
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    items = data.get("jobs", data.get("results", data if isinstance(data, list) else []))
+                cutoff_date = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(days=max_days)
+                for item in items:
+                    posted_at = _parse_posted_at(item.get("posted_at") or item.get("postedAt") or item.get("date"))
+
+                    # Skip stale postings before building their record;
+                    # dates without an offset are taken as UTC
+                    if posted_at is not None:
+                        if posted_at.tzinfo is None:
+                            posted_at = posted_at.replace(tzinfo=datetime.timezone.utc)
+                        if posted_at < cutoff_date:
+                            continue
                     
-                    for item in items:
-                        posted_at = None
-                        date_str = item.get("posted_at") or item.get("postedAt") or item.get("date")
-                        if date_str:
-                            try:
-                                posted_at = datetime.datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-                            except:
-                                pass
-                        
+                    jobs.append({
+                        "title": _first_present(item, HIRING_CAFE_TITLE_KEYS, "Unknown"),
+                        "company": _first_present(item, HIRING_CAFE_COMPANY_KEYS, "Unknown"),
+                        "location": item.get("location", ""),
+                        "description": item.get("description", ""),
+                        "apply_url": _first_present(item, HIRING_CAFE_URL_KEYS, ""),
+                        "posted_at": posted_at,
+                        "tags": item.get("tags", []),
+                    })
+            else:
+                response = await client.get(f"https://hiring.cafe/jobs?q={query}")
+                
+                if response.status_code == 200:
+                    for card in extract_job_cards(
+                        response.text,
+                        HIRING_CAFE_CARD_SELECTOR,
+                        title_selector=HIRING_CAFE_TITLE_SELECTOR,
+                        company_selector=HIRING_CAFE_COMPANY_SELECTOR,
+                    ):
                         jobs.append({
-                            "title": item.get("title", item.get("job_title", "Unknown")),
-                            "company": item.get("company", item.get("company_name", "Unknown")),
-                            "location": item.get("location", ""),
-                            "description": item.get("description", ""),
-                            "apply_url": item.get("url", item.get("apply_url", item.get("link", ""))),
-                            "posted_at": posted_at,
-                            "tags": item.get("tags", []),
+                            "title": card.title,
+                            "company": card.company or "Unknown",
+                            "location": "",
+                            "description": "",
+                            "apply_url": card.href,
+                            "posted_at": None,
+                            "tags": [],
                         })
-                else:
-                    response = await client.get(f"https://hiring.cafe/jobs?q={query}")
-                    
-                    if response.status_code == 200:
-                        soup = BeautifulSoup(response.text, "html.parser")
-                        
-                        for card in soup.select("[class*='job'], article, .posting"):
-                            title_elem = card.select_one("h2, h3, [class*='title']")
-                            company_elem = card.select_one("[class*='company']")
-                            link_elem = card.select_one("a[href]")
-                            
-                            if title_elem and link_elem:
-                                jobs.append({
-                                    "title": title_elem.get_text(strip=True),
-                                    "company": company_elem.get_text(strip=True) if company_elem else "Unknown",
-                                    "location": "",
-                                    "description": "",
-                                    "apply_url": link_elem.get("href", ""),
-                                    "posted_at": None,
-                                    "tags": [],
-                                })
-            except Exception as e:
-                raise Exception(f"Failed to fetch from hiring.cafe: {e}")
+        except Exception as e:
+            raise Exception(f"Failed to fetch from hiring.cafe: {e}")
         
         return jobs
 
@@ -1203,11 +1622,12 @@ class ScrapingSourcesScreen(ModalScreen[bool]):
         self.is_scraping = False
         self.jobs_found = 0
         self.jobs_added = 0
+        # Latest progress and job log not yet written to the screen
+        self._pending_progress: Optional[tuple[float, str]] = None
+        self._pending_job_log: Optional[str] = None
 
     def compose(self) -> ComposeResult:
         """Create child widgets."""
-        from textual.widgets import ProgressBar
-        
         session = get_session()
         try:
             self.sources = list(session.query(ScraperSource).filter(ScraperSource.enabled.is_(True)).all())
@@ -1268,15 +1688,48 @@ class ScrapingSourcesScreen(ModalScreen[bool]):
         if event.value:
             self._update_source_info(str(event.value))
 
+    @cached_property
+    def _progress_bar(self) -> ProgressBar:
+        return self.query_one("#progress-bar", ProgressBar)
+
+    @cached_property
+    def _progress_status(self) -> Static:
+        return self.query_one("#progress-status", Static)
+
+    @cached_property
+    def _job_log(self) -> Static:
+        return self.query_one("#job-log", Static)
+
     def update_progress(self, progress: float, status: str) -> None:
-        """Update progress bar and status."""
-        from textual.widgets import ProgressBar
-        self.query_one("#progress-bar", ProgressBar).update(progress=progress)
-        self.query_one("#progress-status", Static).update(status)
+        """Update progress bar and status.
+
+        Progress arrives once per scraped job, so updates are coalesced
+        into one write per refresh (see _flush_progress).
+        """
+        self._schedule_flush()
+        self._pending_progress = (progress, status)
 
     def update_job_log(self, message: str) -> None:
         """Update the job log with recent activity."""
-        self.query_one("#job-log", Static).update(message)
+        self._schedule_flush()
+        self._pending_job_log = message
+
+    def _schedule_flush(self) -> None:
+        """Schedule a single write of pending updates after the next refresh."""
+        if self._pending_progress is None and self._pending_job_log is None:
+            self.call_after_refresh(self._flush_progress)
+
+    def _flush_progress(self) -> None:
+        """Write the latest pending progress and job log."""
+        progress, self._pending_progress = self._pending_progress, None
+        job_log, self._pending_job_log = self._pending_job_log, None
+        if not self.is_attached:
+            return
+        if progress is not None:
+            self._progress_bar.update(progress=progress[0])
+            self._progress_status.update(progress[1])
+        if job_log is not None:
+            self._job_log.update(job_log)
 
     @on(Button.Pressed, "#scrape-now")
     async def scrape_now(self) -> None:
@@ -1322,7 +1775,7 @@ class ScrapingSourcesScreen(ModalScreen[bool]):
                 # Fall back to the old method for custom URLs
                 jobs = await self._run_scraper_with_progress(self.selected_source)
                 self.update_progress(80, f"Saving {len(jobs)} jobs to database...")
-                added = await self._save_jobs(jobs)
+                added = await asyncio.to_thread(self._save_jobs, jobs)
                 self.update_progress(100, f"✓ Complete! Found {len(jobs)}, added {added} new jobs.")
                 return
             
@@ -1358,7 +1811,7 @@ class ScrapingSourcesScreen(ModalScreen[bool]):
                 
                 elif isinstance(event, ScrapeCompleteEvent):
                     self.update_progress(90, f"Saving {len(all_jobs)} jobs to database...")
-                    added = await self._save_jobs(all_jobs)
+                    added = await asyncio.to_thread(self._save_jobs, all_jobs)
                     self.jobs_added = added
                     
                     # Update last scraped time
@@ -1413,8 +1866,7 @@ class ScrapingSourcesScreen(ModalScreen[bool]):
                             event_type = line[7:]
                         elif line.startswith("data: "):
                             try:
-                                import json
-                                data = json.loads(line[6:])
+                                data = _parse_json(line[6:])
                                 
                                 if event_type == "start":
                                     self.update_progress(10, f"Started scraping {data.get('source_name', '')}...")
@@ -1474,36 +1926,35 @@ class ScrapingSourcesScreen(ModalScreen[bool]):
 
     async def _scrape_hiring_cafe_source(self, config: dict) -> list[dict]:
         """Scrape from hiring.cafe with given config."""
-        from bs4 import BeautifulSoup
         jobs = []
         
         query = config.get("query", "software engineer")
         location = config.get("location", "")
         
-        async with httpx.AsyncClient(timeout=30, follow_redirects=True) as client:
-            params = {"q": query, "limit": config.get("max_results", 50)}
-            if location:
-                params["location"] = location
+        client = self.app.http_client
+        params = {"q": query, "limit": config.get("max_results", 50)}
+        if location:
+            params["location"] = location
+        
+        try:
+            response = await client.get("https://hiring.cafe/api/jobs", params=params)
             
-            try:
-                response = await client.get("https://hiring.cafe/api/jobs", params=params)
+            if response.status_code == 200:
+                data = _parse_json(response.content)
+                items = data.get("jobs", data.get("results", data if isinstance(data, list) else []))
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    items = data.get("jobs", data.get("results", data if isinstance(data, list) else []))
-                    
-                    for item in items:
-                        jobs.append({
-                            "title": item.get("title", item.get("job_title", "Unknown")),
-                            "company": item.get("company", item.get("company_name", "Unknown")),
-                            "location": item.get("location", ""),
-                            "description": item.get("description", ""),
-                            "apply_url": item.get("url", item.get("apply_url", item.get("link", ""))),
-                            "tags": item.get("tags", []),
-                            "source": "hiring.cafe",
-                        })
-            except Exception:
-                pass
+                for item in items:
+                    jobs.append({
+                        "title": _first_present(item, HIRING_CAFE_TITLE_KEYS, "Unknown"),
+                        "company": _first_present(item, HIRING_CAFE_COMPANY_KEYS, "Unknown"),
+                        "location": item.get("location", ""),
+                        "description": item.get("description", ""),
+                        "apply_url": _first_present(item, HIRING_CAFE_URL_KEYS, ""),
+                        "tags": item.get("tags", []),
+                        "source": "hiring.cafe",
+                    })
+        except Exception:
+            pass
         
         return jobs
 
@@ -1511,128 +1962,105 @@ class ScrapingSourcesScreen(ModalScreen[bool]):
         """Scrape from SimplifyJobs GitHub."""
         jobs = []
         
-        async with httpx.AsyncClient(timeout=30, follow_redirects=True) as client:
-            try:
-                response = await client.get(
-                    "https://raw.githubusercontent.com/SimplifyJobs/New-Grad-Positions/dev/README.md"
-                )
-                if response.status_code == 200:
-                    content = response.text
-                    # Parse the markdown table
-                    import re
-                    # Find table rows (lines starting with |)
-                    lines = content.split('\n')
-                    in_table = False
-                    for line in lines:
-                        if '| Company |' in line or '| --- |' in line:
-                            in_table = True
-                            continue
-                        if in_table and line.startswith('|'):
-                            parts = [p.strip() for p in line.split('|')[1:-1]]
-                            if len(parts) >= 4:
-                                company = re.sub(r'\[([^\]]+)\].*', r'\1', parts[0]).strip()
-                                title = parts[1].strip() if len(parts) > 1 else "Software Engineer"
-                                location = parts[2].strip() if len(parts) > 2 else ""
-                                
-                                # Extract URL from markdown link
-                                url_match = re.search(r'\[.*?\]\((.*?)\)', parts[-1] if parts[-1] else parts[0])
-                                apply_url = url_match.group(1) if url_match else ""
-                                
-                                if company and apply_url and "🔒" not in line:
-                                    jobs.append({
-                                        "title": title or "Software Engineer",
-                                        "company": company,
-                                        "location": location,
-                                        "description": "",
-                                        "apply_url": apply_url,
-                                        "tags": ["new-grad"],
-                                        "source": "simplify_jobs",
-                                    })
-            except Exception:
-                pass
+        client = self.app.http_client
+        try:
+            response = await client.get(
+                "https://raw.githubusercontent.com/SimplifyJobs/New-Grad-Positions/dev/README.md"
+            )
+            if response.status_code == 200:
+                content = response.text
+                # Parse the markdown table
+                # Find table rows (lines starting with |)
+                lines = content.split('\n')
+                in_table = False
+                for line in lines:
+                    if '| Company |' in line or '| --- |' in line:
+                        in_table = True
+                        continue
+                    if in_table and line.startswith('|'):
+                        parts = [p.strip() for p in line.split('|')[1:-1]]
+                        if len(parts) >= 4:
+                            company = re.sub(r'\[([^\]]+)\].*', r'\1', parts[0]).strip()
+                            title = parts[1].strip() if len(parts) > 1 else "Software Engineer"
+                            location = parts[2].strip() if len(parts) > 2 else ""
+                            
+                            # Extract URL from markdown link
+                            url_match = re.search(r'\[.*?\]\((.*?)\)', parts[-1] if parts[-1] else parts[0])
+                            apply_url = url_match.group(1) if url_match else ""
+                            
+                            if company and apply_url and "🔒" not in line:
+                                jobs.append({
+                                    "title": title or "Software Engineer",
+                                    "company": company,
+                                    "location": location,
+                                    "description": "",
+                                    "apply_url": apply_url,
+                                    "tags": ["new-grad"],
+                                    "source": "simplify_jobs",
+                                })
+        except Exception:
+            pass
         
         return jobs
 
     async def _scrape_custom_urls(self, config: dict) -> list[dict]:
         """Scrape from custom URLs."""
-        from bs4 import BeautifulSoup
-        from urllib.parse import urljoin
-        
         jobs = []
         urls = config.get("urls", [])
         company = config.get("company", "Unknown")
         
-        async with httpx.AsyncClient(timeout=30, follow_redirects=True) as client:
-            for url in urls:
-                try:
-                    response = await client.get(url)
-                    if response.status_code == 200:
-                        soup = BeautifulSoup(response.text, "html.parser")
-                        
-                        job_selectors = [
-                            "[class*='job-card']", "[class*='job-listing']",
-                            "a[href*='/jobs/']", "a[href*='/careers/']",
-                        ]
+        client = self.app.http_client
+        for url in urls:
+            try:
+                response = await client.get(url)
+                if response.status_code == 200:
+                    seen_urls = set()
+                    for title, link in extract_job_links(response.text):
+                        if link.startswith("/"):
+                            link = urljoin(url, link)
                         
-                        seen_urls = set()
-                        for selector in job_selectors:
-                            for elem in soup.select(selector)[:20]:
-                                title_elem = elem.select_one("h2, h3, h4, [class*='title'], a")
-                                if not title_elem:
-                                    continue
-                                title = title_elem.get_text(strip=True)
-                                if not title:
-                                    continue
-                                
-                                link = elem.get("href") if elem.name == "a" else None
-                                if not link:
-                                    link_elem = elem.select_one("a[href]")
-                                    if link_elem:
-                                        link = link_elem.get("href")
-                                
-                                if not link or link in seen_urls:
-                                    continue
-                                
-                                if link.startswith("/"):
-                                    link = urljoin(url, link)
-                                
-                                seen_urls.add(link)
-                                jobs.append({
-                                    "title": title[:200],
-                                    "company": company,
-                                    "location": None,
-                                    "description": None,
-                                    "apply_url": link,
-                                    "tags": [],
-                                    "source": "custom",
-                                })
-                except Exception:
-                    pass
+                        canonical = canonicalize_url(link)
+                        if canonical in seen_urls:
+                            continue
+                        seen_urls.add(canonical)
+                        jobs.append({
+                            "title": title[:200],
+                            "company": company,
+                            "location": None,
+                            "description": None,
+                            "apply_url": link,
+                            "tags": [],
+                            "source": "custom",
+                        })
+            except Exception:
+                pass
         
         return jobs
 
-    async def _save_jobs(self, jobs: list[dict]) -> int:
-        """Save scraped jobs to database, return count of newly added."""
+    def _save_jobs(self, jobs: list[dict]) -> int:
+        """Save scraped jobs to database, return count of newly added.
+
+        Blocking; call it with asyncio.to_thread from the event loop.
+        """
         session = get_session()
-        added = 0
         try:
-            for job_data in jobs:
-                existing = session.query(Job).filter(Job.apply_url == job_data["apply_url"]).first()
-                if existing:
-                    continue
-                
-                job = Job(
-                    title=job_data["title"],
-                    company=job_data["company"],
-                    location=job_data.get("location"),
-                    description=job_data.get("description"),
-                    apply_url=job_data["apply_url"],
-                    source_url=job_data.get("source", ""),
-                )
-                if job_data.get("tags"):
-                    job.set_tags(job_data["tags"])
-                session.add(job)
-                added += 1
+            # Load fingerprints once so cross-source reposts can be skipped
+            # without a query per job
+            fingerprints = SimHashIndex(
+                value for (value,) in session.query(Job.simhash).filter(Job.simhash.isnot(None))
+            )
+            added = insert_new_jobs(session, [
+                {
+                    "title": job_data["title"],
+                    "company": job_data["company"],
+                    "location": job_data.get("location"),
+                    "description": job_data.get("description"),
+                    "apply_url": job_data["apply_url"],
+                    "source_url": job_data.get("source", ""),
+                    "tags": job_data.get("tags") or [],
+                }
+                for job_data in jobs
+            ], fingerprints)
             session.commit()
         finally:
             session.close()
@@ -1838,6 +2266,75 @@ class SettingsScreen(ModalScreen[bool]):
         self.dismiss(False)
 
 
+# ============================================================================
+# Source Config Collectors
+# ============================================================================
+
+
+def _split_list(value: str) -> list[str]:
+    """Split a comma-separated value into stripped, non-empty items."""
+    return [v.strip() for v in value.split(",") if v.strip()]
+
+
+def _make_field_reader(field: dict) -> Callable[[Callable], object]:
+    """Build a function reading one config field's value from its widget."""
+    name = field["name"]
+    field_type = field["type"]
+    widget_id = f"#config-{name}"
+
+    if field_type == "bool":
+        def read(query_one):
+            return query_one(widget_id, Switch).value
+    elif field_type == "select":
+        def read(query_one):
+            return str(query_one(widget_id, Select).value)
+    elif field_type == "number":
+        number_default = field.get("default", 0)
+
+        def read(query_one):
+            try:
+                return int(query_one(widget_id, Input).value)
+            except ValueError:
+                return number_default
+    elif field_type == "multiline":
+        # Split by comma or newline
+        def read(query_one):
+            return _split_list(query_one(widget_id, Input).value.strip().replace("\n", ","))
+    elif name in ("experience_levels", "categories"):
+        # Comma-separated list entered in a text field
+        def read(query_one):
+            return _split_list(query_one(widget_id, Input).value.strip())
+    else:  # text
+        def read(query_one):
+            return query_one(widget_id, Input).value.strip()
+
+    return read
+
+
+def _build_collector(fields: list[dict]) -> Callable[[Callable], dict]:
+    """Build a function collecting all config values for a source type."""
+    readers = [(field["name"], _make_field_reader(field), field.get("default", "")) for field in fields]
+
+    def collect(query_one) -> dict:
+        config = {}
+        for name, read, default in readers:
+            try:
+                config[name] = read(query_one)
+            except (NoMatches, WrongType):
+                # Field not found, use default
+                config[name] = default
+        return config
+
+    return collect
+
+
+# Field definitions are fixed per source type, so build each collector once
+_COLLECTORS = {
+    source_type: _build_collector(fields)
+    for source_type, fields in ScraperSource.CONFIG_FIELDS.items()
+}
+
+
 class EditSourceScreen(ModalScreen[bool]):
     """Modal screen for editing a scraping source with dynamic config fields."""
 
@@ -2022,49 +2519,8 @@ class EditSourceScreen(ModalScreen[bool]):
 
     def _collect_config(self) -> dict:
         """Collect config values from the dynamic fields."""
-        config = {}
-        fields = ScraperSource.CONFIG_FIELDS.get(self.current_type, [])
-        
-        for field in fields:
-            name = field["name"]
-            field_type = field["type"]
-            widget_id = f"#config-{name}"
-            
-            try:
-                if field_type == "bool":
-                    widget = self.query_one(widget_id, Switch)
-                    config[name] = widget.value
-                elif field_type == "select":
-                    widget = self.query_one(widget_id, Select)
-                    config[name] = str(widget.value)
-                elif field_type == "number":
-                    widget = self.query_one(widget_id, Input)
-                    try:
-                        config[name] = int(widget.value)
-                    except ValueError:
-                        config[name] = field.get("default", 0)
-                elif field_type == "multiline":
-                    widget = self.query_one(widget_id, Input)
-                    # Split by comma or newline
-                    value = widget.value.strip()
-                    if value:
-                        items = [v.strip() for v in value.replace("\n", ",").split(",") if v.strip()]
-                        config[name] = items
-                    else:
-                        config[name] = []
-                else:  # text
-                    widget = self.query_one(widget_id, Input)
-                    value = widget.value.strip()
-                    # Handle comma-separated lists for certain fields
-                    if name in ("experience_levels", "categories"):
-                        config[name] = [v.strip() for v in value.split(",") if v.strip()]
-                    else:
-                        config[name] = value
-            except Exception:
-                # Field not found, use default
-                config[name] = field.get("default", "")
-        
-        return config
+        collector = _COLLECTORS.get(self.current_type)
+        return collector(self.query_one) if collector else {}
 
     @on(Button.Pressed, "#save")
     def save_source(self) -> None:
@@ -2280,12 +2736,98 @@ class JobTrackApp(App):
     def __init__(self) -> None:
         """Initialize the app."""
         super().__init__()
-        self.jobs: list[dict] = []
+        self.jobs: list[JobSummary] = []
         self.applied_jobs: list[dict] = []
+        # Bumped on every status message so a finished background refresh
+        # doesn't overwrite a message set after it was started
+        self._status_serial = 0
+        self._jobs_refresh_serial = 0
+        # (filters, [(job summary, table row), ...]) for the last load
+        self._jobs_cache: Optional[tuple[JobFilters, list[tuple[JobSummary, tuple]]]] = None
+        # Job shown in each job table row, in display order
+        self._row_key_to_job: dict[RowKey, JobSummary] = {}
+        # Job id -> position in the cached dataset, and -> row key on screen
+        self._jobs_by_id: dict[str, int] = {}
+        self._job_row_keys: dict[str, RowKey] = {}
+        # (job, row) entries still to be added to the job table
+        self._pending_job_rows: list[tuple[JobSummary, tuple]] = []
+        self._job_rows_scheduled = False
+        self._show_jobs_timer: Optional[Timer] = None
+        self._history_has_more = False
+        # Tabs whose data changed while hidden; refreshed when next shown
+        self._stale_tabs: set[str] = set()
         self.current_filter = "all"
         self.search_term = ""
         self.selected_profile_id: Optional[str] = None
         self.selected_profile: Optional[Profile] = None
+        # Rendered profile details markup by profile id
+        self._profile_details_cache: dict[str, str] = {}
+
+    @cached_property
+    def http_client(self) -> httpx.AsyncClient:
+        """HTTP client shared by scrapes so connections are kept alive between them.
+
+        httpx requests gzip/deflate responses by default and adds brotli
+        when the brotli package is installed (the fast extra).
+        """
+        return httpx.AsyncClient(
+            timeout=30,
+            follow_redirects=True,
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_keepalive_connections=10),
+        )
+
+    async def on_unmount(self) -> None:
+        """Close the shared HTTP client if it was created."""
+        if "http_client" in self.__dict__:
+            await self.http_client.aclose()
+
+    # Widgets used on hot paths (j/k, filters, refreshes), looked up once.
+    # The main screen is composed once, so the references stay valid.
+
+    @cached_property
+    def _job_table(self) -> DataTable:
+        return self.query_one("#job-table", DataTable)
+
+    @cached_property
+    def _history_table(self) -> DataTable:
+        return self.query_one("#history-table", DataTable)
+
+    @cached_property
+    def _status_bar(self) -> Static:
+        return self.query_one("#status-bar", Static)
+
+    @cached_property
+    def _tabs(self) -> TabbedContent:
+        return self.query_one(TabbedContent)
+
+    @cached_property
+    def _profile_list(self) -> OptionList:
+        return self.query_one("#profile-list", OptionList)
+
+    @cached_property
+    def _profile_details(self) -> Static:
+        return self.query_one("#profile-details", Static)
+
+    @cached_property
+    def _settings_summary(self) -> Static:
+        return self.query_one("#settings-summary", Static)
+
+    @cached_property
+    def _new_grad_filter(self) -> Switch:
+        return self.query_one("#new-grad-filter", Switch)
+
+    @cached_property
+    def _applied_filter(self) -> Switch:
+        return self.query_one("#applied-filter", Switch)
+
+    @cached_property
+    def _pending_filter(self) -> Switch:
+        return self.query_one("#pending-filter", Switch)
+
+    @cached_property
+    def _search_input(self) -> Input:
+        return self.query_one("#search-input", Input)
 
     def compose(self) -> ComposeResult:
         """Create child widgets."""
@@ -2333,13 +2875,14 @@ class JobTrackApp(App):
         # Set the light theme
         self.theme = "textual-light"
         
-        init_db()
+        # No init_db() here: the first worker's get_session() sets up the
+        # schema off the UI thread, and the loads below all run in workers
         
-        table = self.query_one("#job-table", DataTable)
-        table.add_columns("Company", "Title", "Location", "Tags", "Status")
+        table = self._job_table
+        table.add_columns("Company", "Title", "Location", "Tags", ("Status", STATUS_COLUMN))
         table.cursor_type = "row"
         
-        history_table = self.query_one("#history-table", DataTable)
+        history_table = self._history_table
         history_table.add_columns("Company", "Title", "Applied Date", "Profile")
         history_table.cursor_type = "row"
         
@@ -2356,8 +2899,15 @@ class JobTrackApp(App):
 
     @on(TabbedContent.TabActivated)
     def tab_activated(self, event: TabbedContent.TabActivated) -> None:
-        """Handle tab change - update status bar."""
-        self.update_status_bar_for_tab(str(event.pane.id))
+        """Handle tab change - update status bar and load stale data."""
+        tab_id = str(event.pane.id)
+        self.update_status_bar_for_tab(tab_id)
+        if tab_id == "history-tab" and tab_id in self._stale_tabs:
+            self.refresh_history()
+        elif tab_id == "profiles-tab" and tab_id in self._stale_tabs:
+            self.refresh_profiles()
+        elif tab_id == "settings-tab" and tab_id in self._stale_tabs:
+            self.refresh_settings_summary()
 
     def update_status_bar_for_tab(self, tab_id: str) -> None:
         """Update status bar with context-sensitive keybindings."""
@@ -2374,10 +2924,15 @@ class JobTrackApp(App):
         else:
             hints = "r refresh"
         
-        self.query_one("#status-bar", Static).update(f"{hints} | {common}")
+        self._status_bar.update(f"{hints} | {common}")
 
     def refresh_settings_summary(self) -> None:
         """Refresh the settings summary display."""
+        self._refresh_if_visible("settings-tab", self._load_settings_summary)
+
+    @work(thread=True, exclusive=True, group="refresh-settings")
+    def _load_settings_summary(self) -> None:
+        """Query settings and source counts off the UI thread."""
         session = get_session()
         try:
             settings = AppSettings.get_settings(session)
@@ -2400,134 +2955,318 @@ class JobTrackApp(App):
                 "  Press 's' to open scraping sources dropdown",
                 "  Press 'g' to edit settings",
             ]
-            
-            self.query_one("#settings-summary", Static).update("\n".join(lines))
         finally:
             session.close()
 
+        self.call_from_thread(self._settings_summary.update, "\n".join(lines))
+
     def refresh_jobs(self) -> None:
         """Refresh job list from database."""
+        self._jobs_cache = None
+        self._show_jobs()
+
+    def _show_jobs(self) -> None:
+        """Show jobs matching the current search and filter switches.
+
+        Jobs are loaded from the database whenever the search or a switch
+        changes; otherwise the last load is shown again.
+        """
+        self._jobs_refresh_serial = self._status_serial
+        filters = JobFilters(
+            self._search_input.value,
+            self._new_grad_filter.value,
+            self._applied_filter.value,
+            self._pending_filter.value,
+        )
+        if self._jobs_cache is None or self._jobs_cache[0] != filters:
+            self._load_jobs(filters)
+            return
+
+        self._apply_jobs(self._jobs_cache[1])
+
+    @work(thread=True, exclusive=True, group="refresh-jobs")
+    def _load_jobs(self, filters: JobFilters) -> None:
+        """Query jobs off the UI thread, superseding any in-flight refresh."""
         session = get_session()
         try:
-            query = session.query(Job)
-
-            new_grad_filter = self.query_one("#new-grad-filter", Switch).value
-            applied_filter = self.query_one("#applied-filter", Switch).value
-            pending_filter = self.query_one("#pending-filter", Switch).value
-            search_input = self.query_one("#search-input", Input).value
-
-            if not applied_filter:
-                query = query.filter(Job.is_applied.is_(False))
-
-            if new_grad_filter:
-                query = query.filter(Job.tags.contains('"new-grad"'))
-            if applied_filter:
-                query = query.filter(Job.is_applied.is_(True))
-            if pending_filter:
-                query = query.filter(Job.is_pending.is_(True))
-            if search_input:
-                term = f"%{search_input}%"
-                query = query.filter(
-                    (Job.title.ilike(term))
-                    | (Job.company.ilike(term))
-                    | (Job.description.ilike(term))
-                )
-            
+            # Select plain column rows; the detail view loads the full
+            # row (description etc.) on demand. Every filter is applied in
+            # SQL so the flag, tag and search indexes can be used.
             cutoff = datetime.datetime.now() - datetime.timedelta(days=90)
-            query = query.filter(Job.scraped_at >= cutoff)
-
-            jobs = query.order_by(Job.scraped_at.desc()).limit(500).all()
-            self.jobs = [job.to_dict() for job in jobs]
+            query = session.query(*JOB_SUMMARY_COLUMNS).filter(
+                Job.is_applied == filters.applied, Job.scraped_at >= cutoff
+            )
+            if filters.pending:
+                query = query.filter(Job.is_pending == filters.pending)
+            if filters.new_grad:
+                query = query.filter(job_tag_filter("new-grad"))
+            if filters.search:
+                query = query.filter(job_search_filter(session, filters.search))
+
+            query = query.order_by(Job.scraped_at.desc()).limit(MAX_VISIBLE_JOBS)
+            jobs = [JobSummary.from_row(row) for row in query]
+        finally:
+            session.close()
 
-            table = self.query_one("#job-table", DataTable)
-            table.clear()
+        # Build the table rows here too so the UI thread only swaps them in
+        dataset = [(job, _job_table_row(job)) for job in jobs]
+
+        if not get_current_worker().is_cancelled:
+            self.call_from_thread(self._set_jobs_cache, filters, dataset)
+
+    def _set_jobs_cache(self, filters: JobFilters, dataset: list[tuple[JobSummary, tuple]]) -> None:
+        """Store a freshly loaded job list and show it."""
+        self._jobs_cache = (filters, dataset)
+        self._jobs_by_id = {job.id: i for i, (job, _) in enumerate(dataset)}
+        self._show_jobs()
+
+    def _apply_jobs(self, visible: list[tuple[JobSummary, tuple]]) -> None:
+        """Update the job table to show the given (job, row) entries.
+
+        When the rows that stay on screen keep their order and any new rows
+        come after them, only the differences are applied: hidden rows are
+        removed, changed cells updated and new rows appended. Otherwise the
+        table is rebuilt.
+        """
+        jobs = [job for job, _ in visible]
+        table = self._job_table
+        # Finish any rows still streaming in so the table matches self.jobs
+        self._flush_job_rows(len(self._pending_job_rows))
+
+        keep = {job.id for job in jobs}
+        survivors = [job.id for job in self.jobs if job.id in keep]
+        removed = len(self.jobs) - len(survivors)
+        added = len(jobs) - len(survivors)
+        if (
+            self._row_key_to_job
+            and all(job.id == job_id for job, job_id in zip(jobs, survivors))
+            and removed + added < len(survivors)
+        ):
             for job in self.jobs:
-                status = ""
-                if job["is_applied"]:
-                    status = "✓ Applied"
-                elif job["is_pending"]:
-                    status = "⏳ Pending"
-
-                tags = ", ".join(job.get("tags", []))[:20]
-                table.add_row(
-                    job["company"][:25],
-                    job["title"][:40],
-                    (job.get("location") or "")[:20],
-                    tags,
-                    status,
-                    key=job["id"],
-                )
+                if job.id not in keep:
+                    row_key = self._job_row_keys.pop(job.id)
+                    table.remove_row(row_key)
+                    del self._row_key_to_job[row_key]
+
+            column_keys = list(table.columns)
+            for job, row in visible[:len(survivors)]:
+                row_key = self._job_row_keys[job.id]
+                self._row_key_to_job[row_key] = job
+                for column_key, old, new in zip(column_keys, table.get_row(row_key), row):
+                    if old != new:
+                        table.update_cell(row_key, column_key, new)
+
+            self._add_job_rows(visible[len(survivors):])
+        else:
+            table.clear()
+            self._row_key_to_job = {}
+            self._job_row_keys = {}
+            self._add_job_rows(visible)
+        self.jobs = jobs
 
+        if self._status_serial == self._jobs_refresh_serial:
             self.update_status(f"Loaded {len(self.jobs)} jobs")
+
+    def _add_job_rows(self, entries: list[tuple[JobSummary, tuple]]) -> None:
+        """Append (job, row) entries to the job table, a chunk per refresh."""
+        self._pending_job_rows.extend(entries)
+        self._flush_job_rows(JOB_ROW_CHUNK)
+        self._schedule_job_rows()
+
+    def _schedule_job_rows(self) -> None:
+        """Add the next chunk of pending job rows after the next refresh."""
+        if self._pending_job_rows and not self._job_rows_scheduled:
+            self._job_rows_scheduled = True
+            self.call_after_refresh(self._stream_job_rows)
+
+    def _stream_job_rows(self) -> None:
+        """Add a chunk of pending job rows and schedule the next."""
+        self._job_rows_scheduled = False
+        self._flush_job_rows(JOB_ROW_CHUNK)
+        self._schedule_job_rows()
+
+    def _flush_job_rows(self, count: int) -> None:
+        """Add up to count pending job rows to the job table."""
+        if not self._pending_job_rows:
+            return
+        chunk = self._pending_job_rows[:count]
+        del self._pending_job_rows[:count]
+        row_keys = self._job_table.add_rows(row for _, row in chunk)
+        for row_key, (job, _) in zip(row_keys, chunk):
+            self._row_key_to_job[row_key] = job
+            self._job_row_keys[job.id] = row_key
+
+    def _update_job(self, job_id: str, **values) -> bool:
+        """Update columns of a job with a single UPDATE; return whether it exists."""
+        session = get_session()
+        try:
+            result = session.execute(update(Job).where(Job.id == job_id).values(**values))
+            session.commit()
+            return result.rowcount > 0
         finally:
             session.close()
 
+    def _patch_cached_job(self, job_id: str, **fields) -> None:
+        """Apply a change to a shown job summary, dropping it if filtered out.
+
+        Avoids reloading every job after an action that only changes one.
+        """
+        if self._jobs_cache is None:
+            self.refresh_jobs()
+            return
+
+        index = self._jobs_by_id.get(job_id)
+        if index is None:
+            return
+        filters, dataset = self._jobs_cache
+        job = dataset[index][0]
+        for name, value in fields.items():
+            setattr(job, name, value)
+
+        if filters.matches(job):
+            # Update the status cell in place if the row is on screen
+            dataset[index] = (job, _job_table_row(job))
+            row_key = self._job_row_keys.get(job_id)
+            if row_key is not None:
+                self._job_table.update_cell(row_key, STATUS_COLUMN, _job_status(job))
+            return
+
+        del dataset[index]
+        self._jobs_by_id = {job.id: i for i, (job, _) in enumerate(dataset)}
+        self._show_jobs()
+
+    def _refresh_if_visible(self, tab_id: str, load: Callable[[], object]) -> None:
+        """Run load now if tab_id is active, otherwise when it is next shown."""
+        if self._tabs.active == tab_id:
+            self._stale_tabs.discard(tab_id)
+            load()
+        else:
+            self._stale_tabs.add(tab_id)
+
     def refresh_history(self) -> None:
         """Refresh application history."""
+        self._refresh_if_visible("history-tab", self._reload_history)
+
+    def _reload_history(self) -> None:
+        """Reload the history table from its first page."""
+        self._history_has_more = False
+        self._load_history(0)
+
+    @work(thread=True, exclusive=True, group="refresh-history")
+    def _load_history(self, offset: int) -> None:
+        """Query a page of applied jobs and their profile names off the UI thread."""
         session = get_session()
         try:
-            jobs = session.query(Job).filter(Job.is_applied.is_(True)).order_by(Job.applied_at.desc()).all()
-            self.applied_jobs = [job.to_dict() for job in jobs]
-
-            table = self.query_one("#history-table", DataTable)
-            table.clear()
-            for job in self.applied_jobs:
-                profile_name = "N/A"
-                if job.get("profile_id"):
-                    profile = session.query(Profile).filter(Profile.id == job["profile_id"]).first()
-                    if profile:
-                        profile_name = profile.profile_name
-
-                applied_date = ""
-                if job.get("applied_at"):
-                    try:
-                        dt = datetime.datetime.fromisoformat(job["applied_at"])
-                        applied_date = dt.strftime("%Y-%m-%d")
-                    except:
-                        pass
-
-                table.add_row(
-                    job["company"][:25],
-                    job["title"][:35],
-                    applied_date,
-                    profile_name[:15],
-                    key=job["id"],
-                )
+            # Join in the profile names so the page is one query, select
+            # only the columns the history needs, and fetch one extra row
+            # to tell whether another page follows
+            rows = (
+                session.query(*HISTORY_COLUMNS, Profile.profile_name)
+                .outerjoin(Profile, Job.profile_id == Profile.id)
+                .filter(Job.is_applied.is_(True))
+                .order_by(Job.applied_at.desc(), Job.id)
+                .offset(offset)
+                .limit(HISTORY_PAGE_SIZE + 1)
+                .all()
+            )
+            has_more = len(rows) > HISTORY_PAGE_SIZE
+            applied_jobs = [row._asdict() for row in rows[:HISTORY_PAGE_SIZE]]
         finally:
             session.close()
 
+        if not get_current_worker().is_cancelled:
+            self.call_from_thread(self._apply_history, applied_jobs, offset, has_more)
+
+    def _apply_history(self, applied_jobs: list[dict], offset: int, has_more: bool) -> None:
+        """Show a loaded page of applications, replacing or extending the table."""
+        if offset and offset != len(self.applied_jobs):
+            # Page for a list that has since been reloaded
+            return
+
+        rows = [
+            (
+                job["company"][:25],
+                job["title"][:35],
+                job["applied_at"].strftime("%Y-%m-%d") if job["applied_at"] else "",
+                (job["profile_name"] or "N/A")[:15],
+            )
+            for job in applied_jobs
+        ]
+
+        table = self._history_table
+        if offset:
+            self.applied_jobs.extend(applied_jobs)
+        else:
+            self.applied_jobs = applied_jobs
+            table.clear()
+        table.add_rows(rows)
+        self._history_has_more = has_more
+
+    @on(DataTable.RowHighlighted, "#history-table")
+    def history_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
+        """Load the next history page as the cursor nears the end."""
+        if self._history_has_more and event.cursor_row >= len(self.applied_jobs) - HISTORY_PREFETCH_ROWS:
+            self._history_has_more = False
+            self._load_history(len(self.applied_jobs))
+
     def refresh_profiles(self) -> None:
         """Refresh profile list."""
+        # Profiles may have changed, so re-render details on next selection
+        self._profile_details_cache.clear()
+        _list_profile_choices.cache_clear()
+        self._refresh_if_visible("profiles-tab", self._load_profiles)
+
+    @work(thread=True, exclusive=True, group="refresh-profiles")
+    def _load_profiles(self) -> None:
+        """Query profile summaries off the UI thread."""
         session = get_session()
         try:
-            profiles = session.query(Profile).all()
-            profile_list = self.query_one("#profile-list", OptionList)
-            profile_list.clear_options()
-            
-            for profile in profiles:
-                resume_count = len(profile.get_resume_versions())
-                profile_list.add_option(Option(
-                    f"{profile.profile_name} ({profile.get_full_name()}) - {resume_count} resumes",
-                    id=profile.id,
-                ))
-            
-            if profiles and not self.selected_profile_id:
-                self.selected_profile_id = profiles[0].id
-                self._update_profile_details()
+            # Count resumes in SQL rather than parsing each profile's JSON
+            resume_count_column = func.coalesce(
+                func.json_array_length(func.nullif(Profile.resume_versions, "")), 0
+            )
+            # Plain column rows: the list needs no Profile objects
+            rows = session.query(
+                Profile.id, Profile.profile_name, Profile.first_name, Profile.last_name, resume_count_column
+            ).all()
+            options = [
+                (profile_id, f"{profile_name} ({f'{first_name} {last_name}'.strip()}) - {resume_count} resumes")
+                for profile_id, profile_name, first_name, last_name, resume_count in rows
+            ]
         finally:
             session.close()
 
+        if not get_current_worker().is_cancelled:
+            self.call_from_thread(self._apply_profiles, options)
+
+    def _apply_profiles(self, options: list[tuple[str, str]]) -> None:
+        """Populate the profile list with freshly loaded profiles."""
+        profile_list = self._profile_list
+        profile_list.clear_options()
+        
+        for profile_id, label in options:
+            profile_list.add_option(Option(label, id=profile_id))
+        
+        if options and not self.selected_profile_id:
+            self.selected_profile_id = options[0][0]
+            self._update_profile_details()
+
     def _update_profile_details(self) -> None:
         """Update the profile details display."""
         if not self.selected_profile_id:
-            self.query_one("#profile-details", Static).update("No profile selected")
+            self._profile_details.update("No profile selected")
+            return
+
+        cached = self._profile_details_cache.get(self.selected_profile_id)
+        if cached is not None:
+            self._profile_details.update(cached)
             return
 
         session = get_session()
         try:
             profile = session.query(Profile).filter(Profile.id == self.selected_profile_id).first()
             if not profile:
-                self.query_one("#profile-details", Static).update("Profile not found")
+                self._profile_details.update("Profile not found")
                 return
 
             self.selected_profile = profile
@@ -2560,7 +3299,9 @@ class JobTrackApp(App):
             else:
                 details.append("  No resumes uploaded")
             
-            self.query_one("#profile-details", Static).update("\n".join(details))
+            text = "\n".join(details)
+            self._profile_details_cache[profile.id] = text
+            self._profile_details.update(text)
         finally:
             session.close()
 
@@ -2581,46 +3322,72 @@ class JobTrackApp(App):
         """Handle Enter key / row selection on history table - open the job link."""
         job = self.get_selected_applied_job()
         if job and job.get("apply_url"):
-            webbrowser.open(job["apply_url"])
             self.update_status(f"Opened: {job['title']}")
+            self.open_in_browser(job["apply_url"])
+
+    @work(thread=True, group="browser")
+    def open_in_browser(self, url: str) -> None:
+        """Open a URL in the web browser without blocking the UI.
+
+        webbrowser.open may spawn and wait on a launcher such as xdg-open.
+        """
+        webbrowser.open(url)
 
     def update_status(self, message: str) -> None:
         """Update status bar message."""
-        status = self.query_one("#status-bar", Static)
+        self._status_serial += 1
+        query_log = get_query_log()
+        if query_log is not None:
+            message = f"{message} [{query_log.take()} queries]"
+        status = self._status_bar
         status.update(message)
 
-    def get_selected_job(self) -> Optional[dict]:
+    def get_selected_job(self) -> Optional[JobSummary]:
         """Get the currently selected job from jobs tab."""
-        table = self.query_one("#job-table", DataTable)
-        if table.cursor_row is not None and table.cursor_row < len(self.jobs):
-            return self.jobs[table.cursor_row]
-        return None
+        table = self._job_table
+        if not table.is_valid_row_index(table.cursor_row):
+            return None
+        row_key, _ = table.coordinate_to_cell_key(Coordinate(table.cursor_row, 0))
+        return self._row_key_to_job.get(row_key)
 
     def get_selected_applied_job(self) -> Optional[dict]:
         """Get the currently selected job from history tab."""
-        table = self.query_one("#history-table", DataTable)
+        table = self._history_table
         if table.cursor_row is not None and table.cursor_row < len(self.applied_jobs):
             return self.applied_jobs[table.cursor_row]
         return None
 
+    def _schedule_show_jobs(self, delay: float = FILTER_DEBOUNCE_SECONDS) -> None:
+        """Show jobs once filter changes have been quiet for delay seconds.
+
+        Toggling several switches or typing a word then costs a single refresh.
+        """
+        if self._show_jobs_timer is not None:
+            self._show_jobs_timer.stop()
+        self._show_jobs_timer = self.set_timer(delay, self._show_jobs)
+
     @on(Switch.Changed)
     def filter_changed(self) -> None:
         """Handle filter switch changes."""
-        self.refresh_jobs()
+        self._schedule_show_jobs()
+
+    @on(Input.Changed, "#search-input")
+    def search_changed(self) -> None:
+        """Search as the user types, once typing pauses."""
+        self._schedule_show_jobs(SEARCH_DEBOUNCE_SECONDS)
 
     @on(Input.Submitted, "#search-input")
     def search_submitted(self) -> None:
-        """Handle search input submission."""
-        self.refresh_jobs()
+        """Handle search input submission without waiting for the pause."""
+        if self._show_jobs_timer is not None:
+            self._show_jobs_timer.stop()
+            self._show_jobs_timer = None
+        self._show_jobs()
 
     @on(Button.Pressed, "#add-application-btn")
     def add_application_pressed(self) -> None:
         """Handle add application button."""
-        def on_result(result: bool) -> None:
-            if result:
-                self.refresh_history()
-                self.update_status("Application added")
-        self.push_screen(AddApplicationScreen(), on_result)
+        self.action_add_application()
 
     @on(Button.Pressed, "#remove-application-btn")
     def remove_application_pressed(self) -> None:
@@ -2630,19 +3397,14 @@ class JobTrackApp(App):
             self.update_status("No application selected")
             return
         
-        session = get_session()
-        try:
-            db_job = session.query(Job).filter(Job.id == job["id"]).first()
-            if db_job:
-                db_job.is_applied = False
-                db_job.applied_at = None
-                db_job.profile_id = None
-                session.commit()
-                self.refresh_history()
-                self.refresh_jobs()
-                self.update_status(f"Removed application: {job['title']}")
-        finally:
-            session.close()
+        self._remove_application(job)
+
+    def _remove_application(self, job: dict) -> None:
+        """Mark an applied job as not applied."""
+        if self._update_job(job["id"], is_applied=False, applied_at=None, profile_id=None):
+            self.refresh_history()
+            self._patch_cached_job(job["id"], is_applied=False)
+            self.update_status(f"Removed application: {job['title']}")
 
     @on(Button.Pressed, "#new-profile-btn")
     def new_profile_pressed(self) -> None:
@@ -2736,13 +3498,13 @@ class JobTrackApp(App):
                 focused.action_cursor_down()
             else:
                 # Try to find and move cursor in the active tab's table
-                tabs = self.query_one(TabbedContent)
+                tabs = self._tabs
                 if tabs.active == "jobs-tab":
-                    table = self.query_one("#job-table", DataTable)
+                    table = self._job_table
                     table.focus()
                     table.action_cursor_down()
                 elif tabs.active == "history-tab":
-                    table = self.query_one("#history-table", DataTable)
+                    table = self._history_table
                     table.focus()
                     table.action_cursor_down()
         except Exception:
@@ -2756,13 +3518,13 @@ class JobTrackApp(App):
                 focused.action_cursor_up()
             else:
                 # Try to find and move cursor in the active tab's table
-                tabs = self.query_one(TabbedContent)
+                tabs = self._tabs
                 if tabs.active == "jobs-tab":
-                    table = self.query_one("#job-table", DataTable)
+                    table = self._job_table
                     table.focus()
                     table.action_cursor_up()
                 elif tabs.active == "history-tab":
-                    table = self.query_one("#history-table", DataTable)
+                    table = self._history_table
                     table.focus()
                     table.action_cursor_up()
         except Exception:
@@ -2770,62 +3532,48 @@ class JobTrackApp(App):
 
     def action_switch_tab_jobs(self) -> None:
         """Switch to jobs tab."""
-        self.query_one(TabbedContent).active = "jobs-tab"
+        self._tabs.active = "jobs-tab"
         self.update_status_bar_for_tab("jobs-tab")
 
     def action_switch_tab_history(self) -> None:
         """Switch to history tab."""
-        self.query_one(TabbedContent).active = "history-tab"
+        self._tabs.active = "history-tab"
         self.update_status_bar_for_tab("history-tab")
 
     def action_switch_tab_profiles(self) -> None:
         """Switch to profiles tab."""
-        self.query_one(TabbedContent).active = "profiles-tab"
+        self._tabs.active = "profiles-tab"
         self.update_status_bar_for_tab("profiles-tab")
 
     def action_switch_tab_settings(self) -> None:
         """Switch to settings tab."""
-        self.query_one(TabbedContent).active = "settings-tab"
+        self._tabs.active = "settings-tab"
         self.update_status_bar_for_tab("settings-tab")
 
     def action_tab_left(self) -> None:
         """Switch to previous tab (vi-like h or left arrow)."""
-        tabs = self.query_one(TabbedContent)
-        tab_order = ["jobs-tab", "history-tab", "profiles-tab", "settings-tab"]
-        try:
-            current_idx = tab_order.index(tabs.active)
-            new_idx = (current_idx - 1) % len(tab_order)
-            tabs.active = tab_order[new_idx]
-            self.update_status_bar_for_tab(tab_order[new_idx])
-        except ValueError:
-            tabs.active = "jobs-tab"
-            self.update_status_bar_for_tab("jobs-tab")
+        tab_id = PREV_TAB.get(self._tabs.active, "jobs-tab")
+        self._tabs.active = tab_id
+        self.update_status_bar_for_tab(tab_id)
 
     def action_tab_right(self) -> None:
         """Switch to next tab (vi-like l or right arrow)."""
-        tabs = self.query_one(TabbedContent)
-        tab_order = ["jobs-tab", "history-tab", "profiles-tab", "settings-tab"]
-        try:
-            current_idx = tab_order.index(tabs.active)
-            new_idx = (current_idx + 1) % len(tab_order)
-            tabs.active = tab_order[new_idx]
-            self.update_status_bar_for_tab(tab_order[new_idx])
-        except ValueError:
-            tabs.active = "jobs-tab"
-            self.update_status_bar_for_tab("jobs-tab")
+        tab_id = NEXT_TAB.get(self._tabs.active, "jobs-tab")
+        self._tabs.active = tab_id
+        self.update_status_bar_for_tab(tab_id)
 
     def action_focus_table(self) -> None:
         """Focus on the main table of the current tab."""
         try:
-            tabs = self.query_one(TabbedContent)
+            tabs = self._tabs
             if tabs.active == "jobs-tab":
-                table = self.query_one("#job-table", DataTable)
+                table = self._job_table
                 table.focus()
             elif tabs.active == "history-tab":
-                table = self.query_one("#history-table", DataTable)
+                table = self._history_table
                 table.focus()
             elif tabs.active == "profiles-tab":
-                profile_list = self.query_one("#profile-list", OptionList)
+                profile_list = self._profile_list
                 profile_list.focus()
             elif tabs.active == "settings-tab":
                 # Focus settings summary or first focusable element
@@ -2835,18 +3583,18 @@ class JobTrackApp(App):
 
     def action_open_link(self) -> None:
         """Open link - context aware based on current tab."""
-        tabs = self.query_one(TabbedContent)
+        tabs = self._tabs
         if tabs.active == "jobs-tab":
             self.action_open_job()
         elif tabs.active == "history-tab":
             job = self.get_selected_applied_job()
             if job and job.get("apply_url"):
-                webbrowser.open(job["apply_url"])
                 self.update_status(f"Opened: {job['title']}")
+                self.open_in_browser(job["apply_url"])
 
     def action_context_action_a(self) -> None:
         """Context-aware 'a' action - mark applied on jobs, add application on history."""
-        tabs = self.query_one(TabbedContent)
+        tabs = self._tabs
         if tabs.active == "jobs-tab":
             self.action_mark_applied()
         elif tabs.active == "history-tab":
@@ -2854,34 +3602,24 @@ class JobTrackApp(App):
 
     def action_add_application(self) -> None:
         """Add a new application manually."""
-        def on_result(result: bool) -> None:
-            if result:
+        def on_result(job_id: Optional[str]) -> None:
+            if job_id:
                 self.refresh_history()
+                # The application may be for a job already in the list
+                self._patch_cached_job(job_id, is_applied=True, is_pending=False)
                 self.update_status("Application added")
         self.push_screen(AddApplicationScreen(), on_result)
 
     def action_remove_selected(self) -> None:
         """Remove selected item - context aware based on current tab."""
-        tabs = self.query_one(TabbedContent)
+        tabs = self._tabs
         if tabs.active == "history-tab":
             job = self.get_selected_applied_job()
             if not job:
                 self.update_status("No application selected")
                 return
             
-            session = get_session()
-            try:
-                db_job = session.query(Job).filter(Job.id == job["id"]).first()
-                if db_job:
-                    db_job.is_applied = False
-                    db_job.applied_at = None
-                    db_job.profile_id = None
-                    session.commit()
-                    self.refresh_history()
-                    self.refresh_jobs()
-                    self.update_status(f"Removed application: {job['title']}")
-            finally:
-                session.close()
+            self._remove_application(job)
 
     def action_open_job(self) -> None:
         """Open job link in browser and mark as pending."""
@@ -2890,26 +3628,26 @@ class JobTrackApp(App):
             self.update_status("No job selected")
             return
 
-        url = job.get("apply_url")
+        url = job.apply_url
         if url:
-            session = get_session()
-            try:
-                db_job = session.query(Job).filter(Job.id == job["id"]).first()
-                if db_job:
-                    db_job.is_pending = True
-                    session.commit()
-            finally:
-                session.close()
-
-            webbrowser.open(url)
-            self.update_status(f"Opened: {job['title']} - Press 'a' to mark as applied")
-            self.refresh_jobs()
+            self._update_job(job.id, is_pending=True)
+            self.update_status(f"Opened: {job.title} - Press 'a' to mark as applied")
+            self.open_in_browser(url)
+            self._patch_cached_job(job.id, is_pending=True)
 
     def action_view_details(self) -> None:
         """Show job details."""
         job = self.get_selected_job()
-        if job:
-            self.push_screen(JobDetailScreen(job))
+        if not job:
+            return
+
+        session = get_session()
+        try:
+            db_job = session.get(Job, job.id)
+            if db_job:
+                self.push_screen(JobDetailScreen(db_job.to_dict()))
+        finally:
+            session.close()
 
     def action_mark_applied(self) -> None:
         """Mark job as applied with confirmation dialog."""
@@ -2919,39 +3657,32 @@ class JobTrackApp(App):
             return
 
         def on_result(applied: bool) -> None:
-            session = get_session()
-            try:
-                db_job = session.query(Job).filter(Job.id == job["id"]).first()
-                if db_job:
-                    db_job.is_pending = False
-                    if applied:
-                        db_job.is_applied = True
-                        db_job.applied_at = datetime.datetime.now()
-                        if self.selected_profile_id:
-                            db_job.profile_id = self.selected_profile_id
-                        self.update_status(f"Marked as applied: {job['title']}")
-                    else:
-                        self.update_status(f"Not applied: {job['title']}")
-                    session.commit()
-            finally:
-                session.close()
-            self.refresh_jobs()
-            self.refresh_history()
+            values = {"is_pending": False}
+            if applied:
+                values.update(is_applied=True, applied_at=datetime.datetime.now())
+                if self.selected_profile_id:
+                    values["profile_id"] = self.selected_profile_id
+            if self._update_job(job.id, **values):
+                if applied:
+                    self.update_status(f"Marked as applied: {job.title}")
+                else:
+                    self.update_status(f"Not applied: {job.title}")
+            self._patch_cached_job(job.id, is_pending=False, is_applied=bool(applied) or job.is_applied)
+            # Only a new application changes the history
+            if applied:
+                self.refresh_history()
 
-        self.push_screen(ConfirmApplyScreen(job["title"], job["company"]), on_result)
+        self.push_screen(ConfirmApplyScreen(job.title, job.company), on_result)
 
     def action_select_profile(self) -> None:
         """Select a profile for applications."""
         def on_result(profile_id: str | None) -> None:
             if profile_id:
                 self.selected_profile_id = profile_id
-                session = get_session()
-                try:
-                    profile = session.query(Profile).filter(Profile.id == profile_id).first()
-                    if profile:
+                for profile in _list_profile_choices():
+                    if profile.id == profile_id:
                         self.update_status(f"Selected profile: {profile.profile_name}")
-                finally:
-                    session.close()
+                        break
         self.push_screen(ProfileSelectScreen(), on_result)
 
     def action_add_profile(self) -> None:
@@ -2994,9 +3725,9 @@ class JobTrackApp(App):
 
     def action_toggle_filter(self) -> None:
         """Toggle between filter presets."""
-        new_grad = self.query_one("#new-grad-filter", Switch)
-        applied = self.query_one("#applied-filter", Switch)
-        pending = self.query_one("#pending-filter", Switch)
+        new_grad = self._new_grad_filter
+        applied = self._applied_filter
+        pending = self._pending_filter
 
         if not any([new_grad.value, applied.value, pending.value]):
             new_grad.value = True
@@ -3015,12 +3746,28 @@ class JobTrackApp(App):
 
     def action_search(self) -> None:
         """Focus the search input."""
-        search_input = self.query_one("#search-input", Input)
+        search_input = self._search_input
         search_input.focus()
 
 
-def main():
-    """Run the TUI application."""
+def main(debug_queries: Optional[bool] = None):
+    """Run the TUI application.
+
+    Args:
+        debug_queries: Log SQL statements and show per-action query counts.
+            Read from the command line when not given.
+    """
+    if debug_queries is None:
+        parser = argparse.ArgumentParser(description="Job-Track TUI")
+        parser.add_argument(
+            "--debug-queries", action="store_true", help="Log SQL statements and show query counts"
+        )
+        debug_queries = parser.parse_args().debug_queries
+
+    if debug_queries:
+        log_path = get_db_path().parent / "queries.log"
+        enable_query_debugging(log_path)
+
     app = JobTrackApp()
     app.run()
 
@@ -1,36 +1,89 @@
 """Tests for the API server."""
 
+import socket
 import tempfile
 from pathlib import Path
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
 
-from job_track.db.models import init_db
+import job_track.api.server as server_module
+from job_track.api.server import is_safe_url
+from job_track.db.models import Job, Profile, init_db
+from job_track.scraper import simplify_jobs
+from job_track.scraper.scraper import ScrapedJob
 
 
-@pytest.fixture
-def test_client():
-    """Create a test client with a temporary database."""
+def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+
+@pytest.fixture(scope="session")
+def test_engine():
+    """Create one temporary database for the whole test session."""
     with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmpdir:
-        db_path = Path(tmpdir) / "test.db"
-        engine = init_db(db_path)
+        engine = init_db(Path(tmpdir) / "test.db")
+        # pysqlite defers BEGIN and does not nest SAVEPOINTs inside it, so
+        # turn off its own transaction handling and have SQLAlchemy emit
+        # BEGIN (the documented recipe for SAVEPOINT support)
+        event.listen(engine, "connect", _disable_pysqlite_transactions)
+        event.listen(engine, "begin", lambda conn: conn.exec_driver_sql("BEGIN"))
+        engine.dispose()
+        yield engine
+        engine.dispose()
 
-        # Patch the get_session function to use test database
-        import job_track.api.server as server_module
-        from job_track.db.models import get_session as original_get_session
 
-        def test_get_session():
-            return original_get_session(db_path)
+@pytest.fixture(scope="session")
+def api_client():
+    """Create the API test client once for the whole test session."""
+    return TestClient(server_module.app)
 
-        original = server_module.get_session
-        server_module.get_session = test_get_session
 
-        client = TestClient(server_module.app)
-        yield client
+@pytest.fixture
+def db_sessions(test_engine):
+    """Session factory for one test, whose changes are rolled back after it.
 
-        server_module.get_session = original
-        engine.dispose()
+    Sessions join an outer transaction through a SAVEPOINT, so their
+    commits are undone when the test ends.
+    """
+    connection = test_engine.connect()
+    transaction = connection.begin()
+    yield sessionmaker(bind=connection, join_transaction_mode="create_savepoint")
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture
+def test_client(db_sessions, api_client, monkeypatch):
+    """API client whose requests use the test's rolled-back database."""
+    monkeypatch.setattr(server_module, "get_session", db_sessions)
+    return api_client
+
+
+def _add(db_sessions, obj) -> str:
+    session = db_sessions()
+    try:
+        session.add(obj)
+        session.commit()
+        return obj.id
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def job_id(db_sessions):
+    """Insert a job directly, for tests of endpoints other than create."""
+    return _add(db_sessions, Job(title="Software Engineer", company="TechCorp", apply_url="https://techcorp.com/apply"))
+
+
+@pytest.fixture
+def profile_id(db_sessions):
+    """Insert a profile directly, for tests of endpoints other than create."""
+    return _add(db_sessions, Profile(
+        profile_name="Default", first_name="Jane", last_name="Smith", email="jane@example.com",
+    ))
 
 
 class TestJobEndpoints:
@@ -62,33 +115,14 @@ class TestJobEndpoints:
         assert "new-grad" in data["tags"]
         assert data["is_applied"] is False
 
-    def test_get_job(self, test_client):
+    def test_get_job(self, test_client, job_id):
         """Test getting a specific job."""
-        # Create a job first
-        job_data = {
-            "title": "Data Scientist",
-            "company": "DataCorp",
-            "apply_url": "https://datacorp.com/apply",
-        }
-        create_response = test_client.post("/api/jobs", json=job_data)
-        job_id = create_response.json()["id"]
-
-        # Get the job
         response = test_client.get(f"/api/jobs/{job_id}")
         assert response.status_code == 200
-        assert response.json()["title"] == "Data Scientist"
+        assert response.json()["title"] == "Software Engineer"
 
-    def test_update_job(self, test_client):
+    def test_update_job(self, test_client, job_id):
         """Test updating a job."""
-        # Create a job first
-        job_data = {
-            "title": "Product Manager",
-            "company": "ProductCo",
-            "apply_url": "https://productco.com/apply",
-        }
-        create_response = test_client.post("/api/jobs", json=job_data)
-        job_id = create_response.json()["id"]
-
         # Update the job
         update_data = {"location": "New York", "tags": ["product", "senior"]}
         response = test_client.patch(f"/api/jobs/{job_id}", json=update_data)
@@ -96,17 +130,8 @@ class TestJobEndpoints:
         assert response.json()["location"] == "New York"
         assert "product" in response.json()["tags"]
 
-    def test_mark_job_pending(self, test_client):
+    def test_mark_job_pending(self, test_client, job_id):
         """Test marking a job as pending."""
-        # Create a job
-        job_data = {
-            "title": "ML Engineer",
-            "company": "MLCorp",
-            "apply_url": "https://mlcorp.com/apply",
-        }
-        create_response = test_client.post("/api/jobs", json=job_data)
-        job_id = create_response.json()["id"]
-
         # Mark as pending
         response = test_client.post(f"/api/jobs/{job_id}/mark-pending")
         assert response.status_code == 200
@@ -116,17 +141,8 @@ class TestJobEndpoints:
         get_response = test_client.get(f"/api/jobs/{job_id}")
         assert get_response.json()["is_pending"] is True
 
-    def test_confirm_apply(self, test_client):
+    def test_confirm_apply(self, test_client, job_id):
         """Test confirming a job application."""
-        # Create a job
-        job_data = {
-            "title": "DevOps Engineer",
-            "company": "DevOpsCo",
-            "apply_url": "https://devopsco.com/apply",
-        }
-        create_response = test_client.post("/api/jobs", json=job_data)
-        job_id = create_response.json()["id"]
-
         # Confirm application
         response = test_client.post(
             f"/api/jobs/{job_id}/confirm-apply",
@@ -139,17 +155,8 @@ class TestJobEndpoints:
         assert data["applied_at"] is not None
         assert data["profile_id"] == "test-profile-123"
 
-    def test_delete_job(self, test_client):
+    def test_delete_job(self, test_client, job_id):
         """Test deleting a job."""
-        # Create a job
-        job_data = {
-            "title": "Test Job",
-            "company": "TestCo",
-            "apply_url": "https://testco.com/apply",
-        }
-        create_response = test_client.post("/api/jobs", json=job_data)
-        job_id = create_response.json()["id"]
-
         # Delete the job
         response = test_client.delete(f"/api/jobs/{job_id}")
         assert response.status_code == 200
@@ -158,6 +165,21 @@ class TestJobEndpoints:
         get_response = test_client.get(f"/api/jobs/{job_id}")
         assert get_response.status_code == 404
 
+    def test_json_response_encoding(self, test_client):
+        """Test responses are UTF-8 JSON whichever encoder renders them."""
+        test_client.post("/api/jobs", json={
+            "title": "Ingénieur logiciel", "company": "Société", "apply_url": "https://a.com/1",
+        })
+        response = test_client.get("/api/jobs")
+        assert response.headers["content-type"] == "application/json"
+        assert "Ingénieur logiciel".encode() in response.content
+        assert response.json()["jobs"][0]["company"] == "Société"
+
+    def test_unknown_job_not_found(self, test_client):
+        """Test updates and deletes of a missing job return 404."""
+        assert test_client.post("/api/jobs/missing/mark-pending").status_code == 404
+        assert test_client.delete("/api/jobs/missing").status_code == 404
+
 
 class TestProfileEndpoints:
     """Tests for profile-related endpoints."""
@@ -168,54 +190,16 @@ class TestProfileEndpoints:
         assert response.status_code == 200
         assert response.json()["profiles"] == []
 
-    def test_create_profile(self, test_client):
-        """Test creating a new profile."""
-        profile_data = {
+    @pytest.mark.parametrize("profile_data, full_name", [
+        ({
             "profile_name": "Tech Applications",
             "first_name": "John",
             "last_name": "Doe",
             "email": "john@example.com",
             "phone": "+1-555-555-5555",
             "linkedin_url": "https://linkedin.com/in/johndoe",
-        }
-        response = test_client.post("/api/profiles", json=profile_data)
-        assert response.status_code == 200
-        data = response.json()
-        assert data["profile_name"] == "Tech Applications"
-        assert data["first_name"] == "John"
-        assert data["last_name"] == "Doe"
-        assert data["full_name"] == "John Doe"
-        assert data["email"] == "john@example.com"
-        assert data["phone"] == "+1-555-555-5555"
-
-    def test_get_profile(self, test_client):
-        """Test getting a specific profile."""
-        # Create a profile first
-        profile_data = {"profile_name": "Default", "first_name": "Jane", "last_name": "Smith", "email": "jane@example.com"}
-        create_response = test_client.post("/api/profiles", json=profile_data)
-        profile_id = create_response.json()["id"]
-
-        # Get the profile
-        response = test_client.get(f"/api/profiles/{profile_id}")
-        assert response.status_code == 200
-        assert response.json()["full_name"] == "Jane Smith"
-
-    def test_update_profile(self, test_client):
-        """Test updating a profile."""
-        # Create a profile first
-        profile_data = {"profile_name": "Default", "first_name": "Bob", "last_name": "Builder", "email": "bob@example.com"}
-        create_response = test_client.post("/api/profiles", json=profile_data)
-        profile_id = create_response.json()["id"]
-
-        # Update the profile
-        update_data = {"phone": "+1-555-123-4567"}
-        response = test_client.patch(f"/api/profiles/{profile_id}", json=update_data)
-        assert response.status_code == 200
-        assert response.json()["phone"] == "+1-555-123-4567"
-
-    def test_create_profile_with_address(self, test_client):
-        """Test creating a profile with address fields."""
-        profile_data = {
+        }, "John Doe"),
+        ({
             "profile_name": "Home Address Profile",
             "first_name": "Charlie",
             "last_name": "Brown",
@@ -225,41 +209,36 @@ class TestProfileEndpoints:
             "address_state": "IL",
             "address_zip": "62701",
             "address_country": "USA",
-        }
+        }, "Charlie Brown"),
+    ], ids=["contact", "address"])
+    def test_create_profile(self, test_client, profile_data, full_name):
+        """Test creating a new profile echoes the given fields."""
         response = test_client.post("/api/profiles", json=profile_data)
         assert response.status_code == 200
         data = response.json()
-        assert data["full_name"] == "Charlie Brown"
-        assert data["address_street"] == "123 Main St"
-        assert data["address_city"] == "Springfield"
-        assert data["address_state"] == "IL"
-        assert data["address_zip"] == "62701"
-        assert data["address_country"] == "USA"
-
-    def test_update_profile_address(self, test_client):
-        """Test updating profile address fields."""
-        # Create a profile first
-        profile_data = {"profile_name": "Default", "first_name": "Dan", "last_name": "Smith", "email": "dan@example.com"}
-        create_response = test_client.post("/api/profiles", json=profile_data)
-        profile_id = create_response.json()["id"]
-
-        # Update with address
-        update_data = {
-            "address_city": "Boston",
-            "address_state": "MA",
-        }
+        assert data["full_name"] == full_name
+        assert {key: data[key] for key in profile_data} == profile_data
+
+    def test_get_profile(self, test_client, profile_id):
+        """Test getting a specific profile."""
+        # Get the profile
+        response = test_client.get(f"/api/profiles/{profile_id}")
+        assert response.status_code == 200
+        assert response.json()["full_name"] == "Jane Smith"
+
+    @pytest.mark.parametrize("update_data", [
+        {"phone": "+1-555-123-4567"},
+        {"address_city": "Boston", "address_state": "MA"},
+    ], ids=["phone", "address"])
+    def test_update_profile(self, test_client, profile_id, update_data):
+        """Test updating profile fields."""
         response = test_client.patch(f"/api/profiles/{profile_id}", json=update_data)
         assert response.status_code == 200
-        assert response.json()["address_city"] == "Boston"
-        assert response.json()["address_state"] == "MA"
+        data = response.json()
+        assert {key: data[key] for key in update_data} == update_data
 
-    def test_delete_profile(self, test_client):
+    def test_delete_profile(self, test_client, profile_id):
         """Test deleting a profile."""
-        # Create a profile
-        profile_data = {"profile_name": "To Delete", "first_name": "Delete", "last_name": "Me", "email": "delete@example.com"}
-        create_response = test_client.post("/api/profiles", json=profile_data)
-        profile_id = create_response.json()["id"]
-
         # Delete the profile
         response = test_client.delete(f"/api/profiles/{profile_id}")
         assert response.status_code == 200
@@ -274,8 +253,6 @@ class TestUrlValidation:
 
     def test_is_safe_url_blocks_localhost(self):
         """Test that localhost URLs are blocked."""
-        from job_track.api.server import is_safe_url
-
         assert not is_safe_url("http://localhost/test")
         assert not is_safe_url("http://127.0.0.1/test")
         assert not is_safe_url("http://127.0.0.1:8080/test")
@@ -283,21 +260,25 @@ class TestUrlValidation:
 
     def test_is_safe_url_blocks_non_http(self):
         """Test that non-HTTP schemes are blocked."""
-        from job_track.api.server import is_safe_url
-
         assert not is_safe_url("file:///etc/passwd")
         assert not is_safe_url("ftp://example.com")
         assert not is_safe_url("gopher://example.com")
 
-    def test_is_safe_url_allows_public_urls(self):
-        """Test that public HTTP URLs are allowed."""
-        from job_track.api.server import is_safe_url
+    @pytest.fixture
+    def fake_dns(self, monkeypatch):
+        """Resolve hostnames from a fixed table instead of real DNS."""
+        addresses = {"example.com": "93.184.216.34", "google.com": "142.250.80.46", "intranet.example": "10.0.0.5"}
+        monkeypatch.setattr(socket, "gethostbyname", lambda host: addresses[host])
 
-        # Note: These may fail if DNS doesn't resolve
-        # but the function should handle that gracefully
+    def test_is_safe_url_allows_public_urls(self, fake_dns):
+        """Test that public HTTP URLs are allowed."""
         assert is_safe_url("https://example.com/careers")
         assert is_safe_url("https://google.com/jobs")
 
+    def test_is_safe_url_blocks_private_addresses(self, fake_dns):
+        """Test that hostnames resolving to private addresses are blocked."""
+        assert not is_safe_url("https://intranet.example/jobs")
+
 
 class TestScrapeEndpoint:
     """Tests for the scrape endpoint."""
@@ -315,3 +296,42 @@ class TestScrapeEndpoint:
         assert data["added"] == 0
         assert len(data["errors"]) == 2
         assert "not allowed" in data["errors"][0]["error"]
+
+    def test_simplify_jobs_skips_known_urls(self, test_client, monkeypatch):
+        """Test SimplifyJobs results are saved once per canonical URL."""
+        def scraped(title, url):
+            return ScrapedJob(title, "TechCorp", None, None, url, "simplify", ["new-grad"])
+
+        async def fake_scrape(config):
+            return [
+                scraped("Existing", "https://a.com/jobs/1/"),
+                scraped("New", "https://a.com/jobs/2"),
+                scraped("New (tracked link)", "https://a.com/jobs/2?utm_source=gh"),
+            ]
+
+        monkeypatch.setattr(simplify_jobs, "scrape_simplify_jobs", fake_scrape)
+        test_client.post("/api/jobs", json={
+            "title": "Existing", "company": "TechCorp", "apply_url": "https://a.com/jobs/1",
+        })
+
+        data = test_client.post("/api/scrape/simplify-jobs", json={}).json()
+        assert (data["scraped"], data["added"], data["skipped"]) == (3, 1, 2)
+        jobs = test_client.get("/api/jobs").json()["jobs"]
+        assert sorted(job["title"] for job in jobs) == ["Existing", "New"]
+        assert next(job for job in jobs if job["title"] == "New")["tags"] == ["new-grad"]
+
+    def test_simplify_jobs_reports_failing_jobs(self, test_client, monkeypatch):
+        """Test a job that cannot be saved is reported without losing the rest."""
+        async def fake_scrape(config):
+            return [
+                ScrapedJob("Good", "TechCorp", None, None, "https://a.com/jobs/1", "simplify", []),
+                ScrapedJob("No company", None, None, None, "https://a.com/jobs/2", "simplify", []),
+                ScrapedJob("Good", "TechCorp", None, None, "https://a.com/jobs/1", "simplify", []),
+            ]
+
+        monkeypatch.setattr(simplify_jobs, "scrape_simplify_jobs", fake_scrape)
+
+        data = test_client.post("/api/scrape/simplify-jobs", json={}).json()
+        assert (data["scraped"], data["added"], data["skipped"]) == (3, 1, 1)
+        assert [error["job"] for error in data["errors"]] == ["No company"]
+        assert [job["title"] for job in test_client.get("/api/jobs").json()["jobs"]] == ["Good"]
@@ -6,11 +6,15 @@ from pathlib import Path
 
 import pytest
 
+from job_track.db.debug import disable_query_debugging, enable_query_debugging, get_query_log
 from job_track.db.models import (
     Job,
     Profile,
     get_session,
     init_db,
+    insert_new_jobs,
+    job_search_filter,
+    job_tag_filter,
 )
 
 
@@ -78,6 +82,19 @@ class TestJobModel:
         assert "ml" in data["tags"]
         assert data["is_applied"] is False
 
+    def test_job_canonical_url(self, temp_db):
+        """Test canonical_url tracks apply_url without tracking params."""
+        job = Job(
+            title="Backend Engineer",
+            company="TechCorp",
+            apply_url="https://techcorp.com/jobs/42/?utm_source=linkedin",
+        )
+        temp_db.add(job)
+        temp_db.commit()
+
+        assert job.apply_url == "https://techcorp.com/jobs/42/?utm_source=linkedin"
+        assert job.canonical_url == "https://techcorp.com/jobs/42"
+
 
 class TestProfileModel:
     """Tests for the Profile model."""
@@ -161,6 +178,16 @@ class TestProfileModel:
         assert latest["filename"] == "v3.pdf"
         assert latest["is_named"] is False
 
+    def test_profile_resume_sha256(self, temp_db):
+        """Test resume content hashes are stored only when given."""
+        profile = Profile(profile_name="Default", first_name="Bob", last_name="Builder", email="bob@example.com")
+        v1 = profile.add_resume_version("v1.pdf", sha256="ab" * 32)
+        v2 = profile.add_resume_version("v2.pdf")
+
+        assert v1["sha256"] == "ab" * 32
+        assert "sha256" not in v2
+        assert profile.get_resume_versions()[0]["sha256"] == "ab" * 32
+
     def test_profile_to_dict(self, temp_db):
         """Test profile serialization."""
         profile = Profile(
@@ -229,3 +256,161 @@ class TestProfileModel:
         full_addr = profile.get_full_address()
         assert "Boston" in full_addr
         assert "MA" in full_addr
+
+
+class TestDatabaseSetup:
+    """Tests for engine and session setup."""
+
+    def test_sessions_share_cached_engine(self, temp_db):
+        """Test sessions for the same path reuse one pooled engine."""
+        db_path = Path(temp_db.get_bind().url.database)
+        other = get_session(db_path)
+        try:
+            assert other.get_bind() is temp_db.get_bind()
+        finally:
+            other.close()
+
+    def test_concurrent_first_sessions_share_factory(self, tmp_path):
+        """Test threads racing to open the first session set the database up once."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        db_path = tmp_path / "race.db"
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            sessions = list(pool.map(lambda _: get_session(db_path), range(4)))
+        try:
+            assert len({session.get_bind() for session in sessions}) == 1
+            assert sessions[0].query(Job).count() == 0
+        finally:
+            for session in sessions:
+                session.close()
+            sessions[0].get_bind().dispose()
+
+
+class TestJobSearch:
+    """Tests for job text search."""
+
+    def _search(self, session, term):
+        return {job.title for job in session.query(Job).filter(job_search_filter(session, term))}
+
+    def test_search_matches_substrings_case_insensitively(self, temp_db):
+        """Test search matches any part of title, company or description."""
+        temp_db.add(Job(title="Backend Engineer", company="TechCorp", apply_url="https://a.com/1"))
+        temp_db.add(Job(title="Designer", company="ArtCo", apply_url="https://a.com/2",
+                        description="Work with our engineering team"))
+        temp_db.add(Job(title="Analyst", company="DataCorp", apply_url="https://a.com/3"))
+        temp_db.commit()
+
+        assert self._search(temp_db, "ENGINEER") == {"Backend Engineer", "Designer"}
+        assert self._search(temp_db, "echcor") == {"Backend Engineer"}
+        assert self._search(temp_db, "Co") == {"Backend Engineer", "Designer", "Analyst"}
+
+    def test_search_sees_updated_text(self, temp_db):
+        """Test the search index follows edits to job text."""
+        job = Job(title="Intern", company="TechCorp", apply_url="https://a.com/1")
+        temp_db.add(job)
+        temp_db.commit()
+
+        job.title = "Platform Engineer"
+        temp_db.commit()
+
+        assert self._search(temp_db, "platform") == {"Platform Engineer"}
+        assert self._search(temp_db, "intern") == set()
+
+
+class TestJobTags:
+    """Tests for the normalized job tag filter."""
+
+    def _tagged(self, session, tag):
+        return {job.title for job in session.query(Job).filter(job_tag_filter(tag))}
+
+    def test_filter_matches_whole_tags_and_follows_edits(self, temp_db):
+        """Test the tag filter matches exact tags and tracks set_tags and deletes."""
+        grad = Job(title="Grad", company="TechCorp", apply_url="https://a.com/1")
+        grad.set_tags(["new-grad", "remote"])
+        other = Job(title="Other", company="TechCorp", apply_url="https://a.com/2")
+        other.set_tags(["new-grad-xyz"])
+        temp_db.add_all([grad, other])
+        temp_db.commit()
+        insert_new_jobs(temp_db, [
+            {"title": "Bulk", "company": "TechCorp", "apply_url": "https://a.com/3", "tags": ["new-grad"]},
+        ])
+        temp_db.commit()
+
+        assert self._tagged(temp_db, "new-grad") == {"Grad", "Bulk"}
+
+        grad.set_tags(["remote"])
+        other.set_tags(["new-grad"])
+        temp_db.commit()
+        assert self._tagged(temp_db, "new-grad") == {"Other", "Bulk"}
+
+        temp_db.delete(other)
+        temp_db.commit()
+        assert self._tagged(temp_db, "new-grad") == {"Bulk"}
+        assert self._tagged(temp_db, "remote") == {"Grad"}
+
+
+class TestInsertNewJobs:
+    """Tests for batch job insertion."""
+
+    def test_skips_existing_and_repeated_urls(self, temp_db):
+        """Test only jobs with unseen canonical URLs are inserted."""
+        temp_db.add(Job(title="Old", company="TechCorp", apply_url="https://a.com/jobs/1"))
+        temp_db.commit()
+
+        added = insert_new_jobs(temp_db, [
+            {"title": "Dup", "company": "TechCorp", "apply_url": "https://A.com/jobs/1/?utm_source=x"},
+            {"title": "New", "company": "TechCorp", "apply_url": "https://a.com/jobs/2", "tags": ["new-grad"]},
+            {"title": "New again", "company": "TechCorp", "apply_url": "https://a.com/jobs/2?ref=feed"},
+        ])
+        temp_db.commit()
+
+        assert added == 1
+        job = temp_db.query(Job).filter(Job.title == "New").one()
+        assert job.canonical_url == "https://a.com/jobs/2"
+        assert job.get_tags() == ["new-grad"]
+        assert job.id and job.scraped_at is not None
+        assert temp_db.query(Job).count() == 2
+
+    def test_skips_repeated_ids(self, temp_db):
+        """Test a row reusing an earlier row's id is dropped instead of failing the batch."""
+        added = insert_new_jobs(temp_db, [
+            {"id": "same", "title": "First", "company": "TechCorp", "apply_url": "https://a.com/jobs/1"},
+            {"id": "same", "title": "Second", "company": "TechCorp", "apply_url": "https://a.com/jobs/2"},
+        ])
+        temp_db.commit()
+
+        assert added == 1
+        assert [job.title for job in temp_db.query(Job)] == ["First"]
+
+    def test_statement_count_does_not_grow_with_batch(self, temp_db, tmp_path):
+        """Test a batch costs one existence query and one insert, not one per job."""
+        rows = [
+            {"title": f"Job {i}", "company": "TechCorp", "apply_url": f"https://a.com/jobs/{i}"}
+            for i in range(100)
+        ]
+        query_log = enable_query_debugging(tmp_path / "queries.log")
+        try:
+            assert insert_new_jobs(temp_db, rows) == 100
+            assert query_log.take() == 2
+        finally:
+            disable_query_debugging()
+
+
+class TestQueryDebugging:
+    """Tests for development query logging."""
+
+    def test_counts_and_flags_repeated_queries(self, temp_db, tmp_path):
+        """Test statements are counted per action and repeats are logged."""
+        log_path = tmp_path / "queries.log"
+        query_log = enable_query_debugging(log_path)
+        try:
+            for i in range(6):
+                temp_db.get(Job, i + 1)
+            assert query_log.take() == 6
+            assert query_log.take() == 0
+            assert "possible N+1" in log_path.read_text()
+        finally:
+            disable_query_debugging()
+
+        temp_db.get(Job, 100)
+        assert get_query_log() is None
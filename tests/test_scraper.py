@@ -288,4 +288,165 @@ class TestHiringCafeScraper:
         # Should not be detected as new-grad
         assert not scraper._is_new_grad_job("Senior Software Engineer")
         assert not scraper._is_new_grad_job("Staff Engineer")
-        assert not scraper._is_new_grad_job("Principal Developer")
\ No newline at end of file
+        assert not scraper._is_new_grad_job("Principal Developer")
+
+
+class TestSimHash:
+    """Tests for near-duplicate job detection."""
+
+    DESCRIPTION = (
+        "We are looking for a new grad software engineer to join our platform team. "
+        "You will build backend services in Python and Go, work with distributed "
+        "storage systems, and collaborate closely with product and design."
+    )
+
+    def test_reworded_repost_is_near_duplicate(self):
+        """Test that a lightly edited description stays within the threshold."""
+        from job_track.dedup import SimHashIndex, job_simhash
+
+        original = job_simhash("Software Engineer", "Acme", self.DESCRIPTION)
+        repost = job_simhash("Software Engineer", "Acme", self.DESCRIPTION + " Apply today.")
+
+        index = SimHashIndex([original])
+        assert index.find_near(repost) == original
+
+    def test_different_job_is_not_duplicate(self):
+        """Test that unrelated descriptions are not matched."""
+        from job_track.dedup import SimHashIndex, job_simhash
+
+        original = job_simhash("Software Engineer", "Acme", self.DESCRIPTION)
+        other = job_simhash(
+            "Data Analyst",
+            "Globex",
+            "Globex is hiring a data analyst to own reporting for our sales "
+            "organization, build dashboards in Tableau, write SQL against the "
+            "warehouse and present weekly findings to regional leadership teams.",
+        )
+
+        assert SimHashIndex([original]).find_near(other) is None
+
+    def test_short_description_not_fingerprinted(self):
+        """Test that jobs without a real description are not fingerprinted."""
+        from job_track.dedup import job_simhash
+
+        assert job_simhash("Software Engineer", "Acme", None) is None
+        assert job_simhash("Software Engineer", "Acme", "Great role") is None
+
+    def test_simhash_fits_signed_64_bit(self):
+        """Test fingerprints fit an SQLite INTEGER column."""
+        from job_track.dedup import hamming_distance, simhash
+
+        value = simhash(self.DESCRIPTION)
+        assert -(2**63) <= value < 2**63
+        assert hamming_distance(value, value) == 0
+
+
+class TestCanonicalizeUrl:
+    """Tests for apply URL canonicalization."""
+
+    def test_strips_tracking_params(self):
+        """Test tracking parameters are removed and the rest sorted."""
+        from job_track.dedup import canonicalize_url
+
+        url = "HTTPS://Jobs.Example.com/jobs/123/?utm_source=x&gh_jid=5&ref=feed&fbclid=abc&a=1"
+        assert canonicalize_url(url) == "https://jobs.example.com/jobs/123?a=1&gh_jid=5"
+
+    def test_variants_compare_equal(self):
+        """Test tracking variants of the same posting share a key."""
+        from job_track.dedup import canonicalize_url
+
+        assert canonicalize_url("https://example.com/jobs/1?utm_medium=email") == canonicalize_url(
+            "https://example.com/jobs/1/"
+        )
+
+    def test_keeps_route_fragments(self):
+        """Test client-side route fragments are kept and anchors dropped."""
+        from job_track.dedup import canonicalize_url
+
+        assert canonicalize_url("https://example.com/#/jobs/9") == "https://example.com#/jobs/9"
+        assert canonicalize_url("https://example.com/jobs/9#apply") == "https://example.com/jobs/9"
+
+
+class TestExtractJobLinks:
+    """Tests for career page link extraction."""
+
+    HTML = """
+    <div class="job-card"><h3> Backend Engineer </h3><a href="/jobs/1">Apply</a></div>
+    <a href="/jobs/2"><h4>Frontend Engineer</h4></a>
+    <a href="/about">About us</a>
+    """
+
+    def test_extracts_titles_and_links(self):
+        """Test job cards and direct job links are both found."""
+        from job_track.scraper.links import extract_job_links
+
+        links = list(extract_job_links(self.HTML))
+        assert ("Backend Engineer", "/jobs/1") in links
+        assert ("Frontend Engineer", "/jobs/2") in links
+        assert all(href != "/about" for _, href in links)
+
+    def test_bs4_fallback_matches(self):
+        """Test the BeautifulSoup fallback yields the same links."""
+        from job_track.scraper import links
+
+        if not links.SELECTOLAX_AVAILABLE:
+            pytest.skip("selectolax not installed")
+        selectors = links.JOB_LINK_SELECTORS
+        assert list(links._extract_bs4(self.HTML, selectors, 20)) == list(
+            links._extract_selectolax(self.HTML, selectors, 20)
+        )
+
+
+class TestExtractJobCards:
+    """Tests for general career page job card extraction."""
+
+    HTML = """
+    <li class="job-item"><h3>Data Engineer</h3><span class="job-location">Remote</span>
+        <a href="/positions/7">View</a></li>
+    <div class="posting"><a href="https://x.com/jobs/8"><h4>ML Engineer</h4></a></div>
+    <a href="/about">About us</a>
+    """
+
+    def test_extracts_cards_in_document_order(self):
+        """Test cards from every selector come back once, with locations."""
+        from job_track.scraper.links import JobCard, extract_job_cards
+
+        cards = list(extract_job_cards(self.HTML))
+        assert cards[0] == JobCard("Data Engineer", "/positions/7", "Remote")
+        assert JobCard("ML Engineer", "https://x.com/jobs/8", None) in cards
+        assert all(card.href != "/about" for card in cards)
+        assert len({card.href for card in cards}) == len(cards)
+
+    def test_min_title_length(self):
+        """Test short titles are skipped without hiding later cards for the same link."""
+        from job_track.scraper.links import extract_job_cards
+
+        html = """
+        <a href="/jobs/1"><h3>QA</h3></a>
+        <div class="job-card"><h3>QA Engineer</h3><a href="/jobs/1">Apply</a></div>
+        """
+        assert [card.title for card in extract_job_cards(html, min_title_length=3)] == ["QA Engineer"]
+
+    def test_custom_title_and_company_selectors(self):
+        """Test cards can be read with page-specific title and company selectors."""
+        from job_track.scraper.links import JobCard, extract_job_cards
+
+        html = """
+        <article><h2>SWE</h2><span class="company-name">Acme</span><a href="/j/1">Apply</a></article>
+        <article><span class="role-title">PM</span><a href="/j/2">Apply</a></article>
+        """
+        cards = list(extract_job_cards(
+            html, "article", title_selector="h2, [class*='title']", company_selector="[class*='company']",
+        ))
+        assert cards == [JobCard("SWE", "/j/1", None, "Acme"), JobCard("PM", "/j/2", None, None)]
+
+    def test_bs4_fallback_matches(self):
+        """Test the BeautifulSoup fallback yields the same cards."""
+        from job_track.scraper import links
+
+        if not links.SELECTOLAX_AVAILABLE:
+            pytest.skip("selectolax not installed")
+        selector = links.JOB_CARD_SELECTOR
+        assert list(links._cards_bs4(self.HTML, selector, 1)) == list(
+            links._cards_selectolax(self.HTML, selector, 1)
+        )
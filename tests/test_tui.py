@@ -0,0 +1,466 @@
+"""Tests for the TUI."""
+
+import asyncio
+import datetime
+import email.utils
+
+import httpx
+import pytest
+from textual.widgets import Button, DataTable, Input, Label, Switch
+
+import job_track.db.models as models_module
+import job_track.tui.app as app_module
+from job_track.db.debug import disable_query_debugging, get_query_log
+from job_track.db.models import Job, Profile, get_session
+
+
+class TestMain:
+    """Tests for the TUI main() function."""
+
+    def test_debug_queries_enables_query_log(self, tmp_path, monkeypatch):
+        """Test --debug-queries logs next to the database before the app runs."""
+        monkeypatch.setattr(app_module, "get_db_path", lambda: tmp_path / "jobs.db")
+        monkeypatch.setattr(app_module.JobTrackApp, "run", lambda self: None)
+        try:
+            app_module.main(debug_queries=True)
+            assert get_query_log() is not None
+            assert (tmp_path / "queries.log").exists()
+        finally:
+            disable_query_debugging()
+
+
+class TestProfileChoices:
+    """Tests for the profile picker choices."""
+
+    def test_latest_resume_name(self, tmp_path, monkeypatch):
+        """Test the latest resume name, with 'N/A' for unnamed versions."""
+        db_path = tmp_path / "test.db"
+        session = get_session(db_path)
+        try:
+            for name, versions in [
+                ("None", None),
+                ("Named", '[{"filename": "a.pdf", "name": "Old"}, {"filename": "b.pdf", "name": "Tech"}]'),
+                ("Unnamed", '[{"filename": "a.pdf"}]'),
+            ]:
+                session.add(Profile(profile_name=name, first_name="A", last_name="B", email="a@b.c",
+                                    resume_versions=versions))
+            session.commit()
+        finally:
+            session.close()
+
+        monkeypatch.setattr(app_module, "get_session", lambda: get_session(db_path))
+        app_module._list_profile_choices.cache_clear()
+        try:
+            choices = {choice.profile_name: choice.latest_resume_name for choice in app_module._list_profile_choices()}
+        finally:
+            app_module._list_profile_choices.cache_clear()
+        assert choices == {"None": None, "Named": "Tech", "Unnamed": "N/A"}
+
+
+class TestJobTable:
+    """Tests for loading the job table."""
+
+    async def test_filters_and_limit_apply_in_sql(self, tmp_path, monkeypatch):
+        """Test filter switches reload matching jobs, newest first, up to the table limit."""
+        db_path = tmp_path / "jobs.db"
+        monkeypatch.setattr(models_module, "get_db_path", lambda: db_path)
+        monkeypatch.setattr(app_module, "MAX_VISIBLE_JOBS", 5)
+        session = get_session(db_path)
+        try:
+            for i in range(8):
+                job = Job(title=f"Job {i}", company="TechCorp", apply_url=f"https://a.com/{i}",
+                          scraped_at=datetime.datetime.now() - datetime.timedelta(hours=i),
+                          is_applied=i == 0)
+                job.set_tags(["new-grad"] if i % 2 else [])
+                session.add(job)
+            session.commit()
+        finally:
+            session.close()
+
+        app = app_module.JobTrackApp()
+        async with app.run_test() as pilot:
+            table = app.query_one("#job-table", DataTable)
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            assert [job.title for job in app.jobs] == [f"Job {i}" for i in range(1, 6)]
+
+            app.query_one("#new-grad-filter", Switch).value = True
+            await pilot.pause(app_module.FILTER_DEBOUNCE_SECONDS + 0.05)
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            assert [job.title for job in app.jobs] == ["Job 1", "Job 3", "Job 5", "Job 7"]
+            assert table.row_count == 4
+
+    @pytest.fixture
+    def db_path(self, tmp_path, monkeypatch):
+        """Point the app at a temporary database holding jobs job-0 to job-4, newest first."""
+        db_path = tmp_path / "jobs.db"
+        monkeypatch.setattr(models_module, "get_db_path", lambda: db_path)
+        session = get_session(db_path)
+        try:
+            for i in range(5):
+                session.add(self._job(i))
+            session.commit()
+        finally:
+            session.close()
+        return db_path
+
+    @staticmethod
+    def _job(i, hours_ago=None):
+        """Return job-i, scraped i hours ago unless hours_ago is given."""
+        scraped_at = datetime.datetime.now() - datetime.timedelta(hours=i if hours_ago is None else hours_ago)
+        return Job(id=f"job-{i}", title=f"Job {i}", company="TechCorp", apply_url=f"https://a.com/{i}",
+                   scraped_at=scraped_at)
+
+    @staticmethod
+    def _shown_ids(app):
+        """Return the job ids in table order."""
+        table = app.query_one("#job-table", DataTable)
+        return [app._row_key_to_job[row.key].id for row in table.ordered_rows]
+
+    @staticmethod
+    async def _reload(app, pilot):
+        """Reload the job list from the database and wait for the table."""
+        app.refresh_jobs()
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+
+    async def test_reload_applies_differences(self, db_path):
+        """Test a reload removes, edits and appends rows without rebuilding the table."""
+        app = app_module.JobTrackApp()
+        async with app.run_test() as pilot:
+            table = app.query_one("#job-table", DataTable)
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            row_keys = dict(app._job_row_keys)
+
+            session = get_session(db_path)
+            try:
+                session.delete(session.get(Job, "job-1"))
+                session.get(Job, "job-2").title = "Job 2 (edited)"
+                session.add(self._job(9))
+                session.commit()
+            finally:
+                session.close()
+            await self._reload(app, pilot)
+
+            assert self._shown_ids(app) == ["job-0", "job-2", "job-3", "job-4", "job-9"]
+            assert [job.id for job in app.jobs] == self._shown_ids(app)
+            # Rows that stayed keep their keys, so they were not re-added
+            assert all(app._job_row_keys[job_id] == row_keys[job_id] for job_id in ["job-0", "job-2", "job-3", "job-4"])
+            assert table.get_row(app._job_row_keys["job-2"])[1] == "Job 2 (edited)"
+            assert table.get_row(app._job_row_keys["job-9"])[1] == "Job 9"
+
+    async def test_reload_rebuilds_when_order_changes(self, db_path):
+        """Test a job inserted before the shown rows rebuilds the table in order."""
+        app = app_module.JobTrackApp()
+        async with app.run_test() as pilot:
+            table = app.query_one("#job-table", DataTable)
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+
+            session = get_session(db_path)
+            try:
+                session.add(self._job(9, hours_ago=-1))
+                session.commit()
+            finally:
+                session.close()
+            await self._reload(app, pilot)
+
+            assert self._shown_ids(app) == ["job-9", "job-0", "job-1", "job-2", "job-3", "job-4"]
+            assert [table.get_row(app._job_row_keys[job.id])[1] for job in app.jobs] == [job.title for job in app.jobs]
+
+    async def test_patch_cached_job(self, db_path):
+        """Test patching a job updates its status cell, or drops it once it no longer matches."""
+        app = app_module.JobTrackApp()
+        async with app.run_test() as pilot:
+            table = app.query_one("#job-table", DataTable)
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+
+            app._patch_cached_job("job-2", is_pending=True)
+            await pilot.pause()
+            assert table.get_cell(app._job_row_keys["job-2"], app_module.STATUS_COLUMN) == app_module.STATUS_PENDING
+
+            app._patch_cached_job("job-1", is_applied=True)
+            await pilot.pause()
+            assert self._shown_ids(app) == ["job-0", "job-2", "job-3", "job-4"]
+            assert [job.id for job in app.jobs] == self._shown_ids(app)
+            assert "job-1" not in app._job_row_keys
+
+
+class TestHistory:
+    """Tests for the application history tab."""
+
+    async def test_pages_append_without_duplicates(self, tmp_path, monkeypatch):
+        """Test moving to the end of the history loads the next pages once each."""
+        db_path = tmp_path / "jobs.db"
+        monkeypatch.setattr(models_module, "get_db_path", lambda: db_path)
+        monkeypatch.setattr(app_module, "HISTORY_PAGE_SIZE", 5)
+        monkeypatch.setattr(app_module, "HISTORY_PREFETCH_ROWS", 1)
+        applied_at = datetime.datetime(2026, 10, 1)
+        session = get_session(db_path)
+        try:
+            # Pairs of applications share an applied date, so pages split ties
+            for i in range(12):
+                session.add(Job(id=f"job-{i:02d}", title=f"Job {i}", company="TechCorp",
+                                apply_url=f"https://a.com/{i}", is_applied=True,
+                                applied_at=applied_at - datetime.timedelta(days=i // 2)))
+            session.commit()
+        finally:
+            session.close()
+
+        app = app_module.JobTrackApp()
+        async with app.run_test() as pilot:
+            table = app.query_one("#history-table", DataTable)
+            await pilot.pause()
+            app._tabs.active = "history-tab"
+            await pilot.pause()
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            assert table.row_count == 5
+
+            for expected in (10, 12):
+                table.focus()
+                table.move_cursor(row=table.row_count - 1)
+                await pilot.pause()
+                await app.workers.wait_for_complete()
+                await pilot.pause()
+                assert table.row_count == expected
+
+            ids = [job["id"] for job in app.applied_jobs]
+            assert ids == [f"job-{i:02d}" for i in range(12)]
+            assert not app._history_has_more
+
+
+class TestResumeUpload:
+    """Tests for the resume upload screen."""
+
+    @pytest.fixture
+    def profile_id(self, tmp_path, monkeypatch):
+        """Create a profile in a temporary database with a temporary resume directory."""
+        db_path = tmp_path / "jobs.db"
+        resume_dir = tmp_path / "resumes"
+        resume_dir.mkdir()
+        monkeypatch.setattr(models_module, "get_db_path", lambda: db_path)
+        monkeypatch.setattr(app_module, "get_resume_dir", lambda profile_id: resume_dir)
+        session = get_session(db_path)
+        try:
+            profile = Profile(profile_name="Me", first_name="A", last_name="B", email="a@b.c")
+            session.add(profile)
+            session.commit()
+            return profile.id
+        finally:
+            session.close()
+
+    @staticmethod
+    async def _upload(app, pilot, profile_id, path, name=""):
+        """Submit the upload form and return the screen once the copy finishes."""
+        screen = app_module.ResumeUploadScreen(profile_id)
+        await app.push_screen(screen)
+        screen.query_one("#filepath-input", Input).value = str(path)
+        screen.query_one("#name-input", Input).value = name
+        screen.upload_resume()
+        # Dismissing the screen cancels its worker, so wait for the worker
+        # to leave the manager rather than for it to complete
+        while any(worker.group == "resume-upload" for worker in app.workers):
+            await pilot.pause(0.01)
+        await pilot.pause()
+        return screen
+
+    async def test_identical_content_reuses_stored_file(self, tmp_path, profile_id):
+        """Test uploading the same content twice keeps one stored copy."""
+        first = tmp_path / "resume.pdf"
+        second = tmp_path / "resume-copy.pdf"
+        first.write_bytes(b"%PDF-1.4 resume")
+        second.write_bytes(b"%PDF-1.4 resume")
+
+        app = app_module.JobTrackApp()
+        async with app.run_test() as pilot:
+            await self._upload(app, pilot, profile_id, first)
+            await self._upload(app, pilot, profile_id, second, name="Tech")
+
+        session = get_session()
+        try:
+            versions = session.get(Profile, profile_id).get_resume_versions()
+        finally:
+            session.close()
+        assert [version["name"] for version in versions] == ["Resume 1", "Tech"]
+        assert versions[0]["filename"] == versions[1]["filename"]
+        assert [path.name for path in (tmp_path / "resumes").iterdir()] == [versions[0]["filename"]]
+
+    async def test_unreadable_file_is_reported(self, tmp_path, profile_id):
+        """Test a file that cannot be read is reported on the form."""
+        app = app_module.JobTrackApp()
+        async with app.run_test() as pilot:
+            # A directory passes the exists() check but cannot be opened
+            screen = await self._upload(app, pilot, profile_id, tmp_path)
+            assert app.screen is screen
+            assert "Could not copy resume" in str(screen.query_one("#resume-info", Label).render())
+            assert not screen.query_one("#upload", Button).disabled
+
+
+class TestScrapeLever:
+    """Tests for scraping a Lever job board."""
+
+    @pytest.mark.parametrize("url, expected", [
+        ("https://jobs.lever.co/acme", "https://jobs.lever.co/acme?mode=json"),
+        ("https://jobs.lever.co/acme/", "https://jobs.lever.co/acme?mode=json"),
+        ("https://jobs.lever.co/acme?team=Eng", "https://jobs.lever.co/acme?team=Eng&mode=json"),
+        ("https://jobs.lever.co/acme?mode=html&team=Eng", "https://jobs.lever.co/acme?team=Eng&mode=json"),
+        ("https://jobs.lever.co/acme#openings", "https://jobs.lever.co/acme?mode=json"),
+        ("https://jobs.lever.co/acme/1234-abcd/apply", "https://jobs.lever.co/acme?mode=json"),
+        ("https://api.lever.co/v0/postings/acme/api/", "https://api.lever.co/v0/postings/acme/api"),
+    ])
+    def test_lever_api_url(self, url, expected):
+        """Test board URLs map to the JSON postings URL."""
+        assert app_module._lever_api_url(url) == expected
+
+    async def test_api_jobs_cancel_page_fetch(self):
+        """Test a successful API request cancels the page fetch started alongside it."""
+        screen = app_module.ScrapeScreen()
+        general_started = asyncio.Event()
+        general_cancelled = asyncio.Event()
+
+        async def scrape_general(url, company):
+            general_started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                general_cancelled.set()
+                raise
+            return [{"title": "Page"}]
+
+        async def scrape_lever_api(url, company):
+            await general_started.wait()
+            return [{"title": "API"}]
+
+        screen._scrape_general = scrape_general
+        screen._scrape_lever_api = scrape_lever_api
+        assert await screen._scrape_lever("https://jobs.lever.co/acme", "Acme") == [{"title": "API"}]
+        await asyncio.wait_for(general_cancelled.wait(), 1)
+
+    async def test_api_failure_uses_page(self):
+        """Test the page scrape result is used when the API request fails."""
+        screen = app_module.ScrapeScreen()
+
+        async def scrape_general(url, company):
+            return [{"title": "Page"}]
+
+        async def scrape_lever_api(url, company):
+            raise httpx.ConnectError("down")
+
+        screen._scrape_general = scrape_general
+        screen._scrape_lever_api = scrape_lever_api
+        assert await screen._scrape_lever("https://jobs.lever.co/acme", "Acme") == [{"title": "Page"}]
+
+
+class TestGetWithRetry:
+    """Tests for retrying HTTP requests."""
+
+    @pytest.fixture
+    def sleeps(self, monkeypatch):
+        """Record retry waits instead of sleeping."""
+        waits = []
+
+        async def sleep(delay):
+            waits.append(delay)
+
+        monkeypatch.setattr(app_module.asyncio, "sleep", sleep)
+        return waits
+
+    @staticmethod
+    def _client(*responses):
+        """Return a client answering with the given responses or errors, and its request log."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            result = responses[min(len(requests), len(responses)) - 1]
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler)), requests
+
+    async def test_retry_after_seconds(self, sleeps):
+        """Test a Retry-After given in seconds sets the wait."""
+        client, requests = self._client(httpx.Response(429, headers={"Retry-After": "7"}), httpx.Response(200))
+        response = await app_module._get_with_retry(client, "https://a.com/")
+        assert response.status_code == 200
+        assert (len(requests), sleeps) == (2, [7.0])
+
+    async def test_retry_after_http_date(self, sleeps):
+        """Test a Retry-After given as an HTTP date waits until that time."""
+        when = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(seconds=20)
+        client, _ = self._client(
+            httpx.Response(503, headers={"Retry-After": email.utils.format_datetime(when, usegmt=True)}),
+            httpx.Response(200),
+        )
+        assert (await app_module._get_with_retry(client, "https://a.com/")).status_code == 200
+        assert len(sleeps) == 1 and 18 <= sleeps[0] <= 20
+
+    def test_delay_is_capped(self):
+        """Test backoff and Retry-After waits never exceed MAX_RETRY_DELAY."""
+        assert app_module._retry_delay(None, 10) == app_module.MAX_RETRY_DELAY
+        response = httpx.Response(429, headers={"Retry-After": "3600"})
+        assert app_module._retry_delay(response, 0) == app_module.MAX_RETRY_DELAY
+
+    async def test_gives_up_after_attempts(self, sleeps):
+        """Test the last retryable response is returned once attempts are used up."""
+        client, requests = self._client(httpx.Response(503, headers={"Retry-After": "0"}))
+        response = await app_module._get_with_retry(client, "https://a.com/", attempts=3)
+        assert response.status_code == 503
+        assert (len(requests), sleeps) == (3, [0.0, 0.0])
+
+    async def test_gives_up_when_wait_budget_is_spent(self, sleeps):
+        """Test retrying stops before the total wait passes MAX_RETRY_WAIT."""
+        client, requests = self._client(httpx.Response(429, headers={"Retry-After": "25"}))
+        response = await app_module._get_with_retry(client, "https://a.com/")
+        assert response.status_code == 429
+        assert (len(requests), sleeps) == (3, [25.0, 25.0])
+
+    async def test_connect_errors_are_retried(self, sleeps):
+        """Test connection failures are retried and the last one is raised."""
+        client, requests = self._client(httpx.ConnectError("refused"))
+        with pytest.raises(httpx.ConnectError):
+            await app_module._get_with_retry(client, "https://a.com/", attempts=2)
+        assert len(requests) == 2
+
+    async def test_read_timeouts_are_not_retried(self, sleeps):
+        """Test a read timeout is raised at once rather than waited out again."""
+        client, requests = self._client(httpx.ReadTimeout("slow"))
+        with pytest.raises(httpx.ReadTimeout):
+            await app_module._get_with_retry(client, "https://a.com/")
+        assert (len(requests), sleeps) == (1, [])
+
+
+class TestParsePostedAt:
+    """Tests for parsing posting dates."""
+
+    @pytest.fixture(params=[False, True], ids=["fromisoformat", "ciso8601"])
+    def parse_posted_at(self, request, monkeypatch):
+        """Return _parse_posted_at using the fallback parser or ciso8601."""
+        if request.param:
+            monkeypatch.setattr(app_module, "ciso8601", pytest.importorskip("ciso8601"), raising=False)
+        monkeypatch.setattr(app_module, "CISO8601_AVAILABLE", request.param)
+        return app_module._parse_posted_at
+
+    def test_naive(self, parse_posted_at):
+        """Test a date without an offset stays naive."""
+        assert parse_posted_at("2026-10-01T12:30:00") == datetime.datetime(2026, 10, 1, 12, 30)
+
+    @pytest.mark.parametrize("value", ["2026-10-01T14:30:00+02:00", "2026-10-01T12:30:00Z"])
+    def test_offset(self, parse_posted_at, value):
+        """Test an offset or trailing Z gives an aware datetime."""
+        assert parse_posted_at(value) == datetime.datetime(2026, 10, 1, 12, 30, tzinfo=datetime.timezone.utc)
+
+    def test_epoch_milliseconds(self, parse_posted_at):
+        """Test epoch milliseconds are read as UTC."""
+        when = datetime.datetime(2026, 10, 1, 12, 30, tzinfo=datetime.timezone.utc)
+        assert parse_posted_at(int(when.timestamp() * 1000)) == when
+
+    @pytest.mark.parametrize("value", [None, "", "not a date", "2026-13-45", True, {"date": "2026-10-01"}, 10 ** 20])
+    def test_missing_or_invalid(self, parse_posted_at, value):
+        """Test missing and unparseable values give None."""
+        assert parse_posted_at(value) is None